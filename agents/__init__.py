@@ -1,4 +1,4 @@
 from .base import Agent
-from .types import AgentResult, TokenUsage
+from .types import AgentResult, RunResult, TokenCounter, TokenUsage
 
-__all__ = ["Agent", "AgentResult", "TokenUsage"]
+__all__ = ["Agent", "AgentResult", "TokenUsage", "TokenCounter", "RunResult"]
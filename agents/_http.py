@@ -0,0 +1,57 @@
+"""Shared HTTP connection pooling for agent backends."""
+
+import asyncio
+from weakref import WeakKeyDictionary
+
+import httpx
+
+_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
+_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+
+class _SharedTransport(httpx.AsyncHTTPTransport):
+    """Connection pool that outlives the clients using it.
+
+    MCP transports create and close an httpx client per session (i.e. per tool call),
+    which would otherwise tear down the TCP connection every time.
+    """
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+# One pool per event loop: pooled connections are bound to the loop that opened them.
+_transports: WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedTransport] = WeakKeyDictionary()
+
+
+def _shared_transport() -> _SharedTransport:
+    loop = asyncio.get_running_loop()
+    transport = _transports.get(loop)
+    if transport is None:
+        transport = _transports[loop] = _SharedTransport(limits=_LIMITS)
+    return transport
+
+
+async def aclose_pooled_transport() -> None:
+    """Close the running loop's shared pool. Call once its clients are done, before the loop exits."""
+    transport = _transports.pop(asyncio.get_running_loop(), None)
+    if transport is not None:
+        await httpx.AsyncHTTPTransport.aclose(transport)
+
+
+def pooled_httpx_client_factory(
+    headers: dict[str, str] | None = None,
+    timeout: httpx.Timeout | None = None,
+    auth: httpx.Auth | None = None,
+) -> httpx.AsyncClient:
+    """httpx client factory for MCP connections whose clients share one keep-alive pool."""
+    return httpx.AsyncClient(
+        transport=_shared_transport(),
+        headers=headers,
+        timeout=timeout or _TIMEOUT,
+        auth=auth,
+        follow_redirects=True,
+    )
@@ -1,5 +1,6 @@
 import os
 import time
+from collections.abc import Callable
 from typing import Any
 
 from claude_agent_sdk import (
@@ -16,7 +17,7 @@ from claude_agent_sdk import (
 )
 from loguru import logger
 
-from agents.types import AgentResult, TokenUsage
+from agents.types import AgentResult, TokenCounter
 from tasks.types import Task
 
 
@@ -32,26 +33,27 @@ def _msg_type(msg: Any) -> str:
     return type(msg).__name__.upper()
 
 
+def _render_tool_result(block: ToolResultBlock) -> str:
+    result_content = block.content if isinstance(block.content, str) else str(block.content)
+    return f"<tool_result tool_use_id={block.tool_use_id} is_error={block.is_error}> {result_content}"
+
+
+# Block type -> renderer; unknown block types fall back to str()
+_RENDERERS: dict[type, Callable[[Any], str]] = {
+    TextBlock: lambda b: b.text,
+    ThinkingBlock: lambda b: f"<thinking>{b.thinking}</thinking>",
+    ToolUseBlock: lambda b: f"<tool_use name={b.name} input={b.input}>",
+    ToolResultBlock: _render_tool_result,
+}
+
+
 def _msg_content(msg: Any) -> str:
     content = getattr(msg, "content", None)
     if content is None:
         return getattr(msg, "result", "") or ""
     if isinstance(content, str):
         return content
-    parts = []
-    for block in content:
-        if isinstance(block, TextBlock):
-            parts.append(block.text)
-        elif isinstance(block, ThinkingBlock):
-            parts.append(f"<thinking>{block.thinking}</thinking>")
-        elif isinstance(block, ToolUseBlock):
-            parts.append(f"<tool_use name={block.name} input={block.input}>")
-        elif isinstance(block, ToolResultBlock):
-            result_content = block.content if isinstance(block.content, str) else str(block.content)
-            parts.append(f"<tool_result tool_use_id={block.tool_use_id} is_error={block.is_error}> {result_content}")
-        else:
-            parts.append(str(block))
-    return "\n".join(parts)
+    return "\n".join([_RENDERERS.get(type(block), str)(block) for block in content])
 
 
 # Server name used as the MCP namespace in allowed_tools
@@ -68,16 +70,21 @@ class ClaudeAgentSDKAgent:
         self._model = model_env
         self._mcp_server = mcp_server
         self._max_turns = max_turns
+        # Options only depend on the system prompt and turn cap, so build them once and reuse across tasks.
+        # Each task still gets its own ClaudeSDKClient: a client is a single CLI conversation,
+        # and sharing it would leak earlier tasks' history into later ones.
+        self._options: ClaudeAgentOptions | None = None
+        self._options_key: tuple[str, int] | None = None
         logger.debug("ClaudeAgentSDKAgent using model: {}", self._model)
         if mcp_server:
             logger.debug("MCP server configured: {}", mcp_server.get("url"))
 
-    def _build_options(self, system_prompt: str) -> ClaudeAgentOptions:
+    def _build_options(self, system_prompt: str, max_turns: int) -> ClaudeAgentOptions:
         kwargs: dict[str, Any] = {
             "model": self._model,
             "system_prompt": system_prompt if system_prompt else None,
             "permission_mode": "bypassPermissions",
-            "max_turns": self._max_turns,
+            "max_turns": max_turns,
         }
 
         kwargs["allowed_tools"] = ["Read", "Edit", "Glob", "Bash", "Grep"]
@@ -94,12 +101,20 @@ class ClaudeAgentSDKAgent:
 
         return ClaudeAgentOptions(**kwargs)
 
+    def _get_options(self, system_prompt: str, max_turns: int | None = None) -> ClaudeAgentOptions:
+        key = (system_prompt, max_turns or self._max_turns)
+        if self._options is None or key != self._options_key:
+            self._options = self._build_options(*key)
+            self._options_key = key
+        return self._options
+
     async def run(self, task: Task, system_prompt: str = "You are helpful ai assistant") -> AgentResult:
-        options = self._build_options(system_prompt)
+        options = self._get_options(system_prompt, task.max_turns)
 
         start = time.perf_counter()
         response_text = ""
-        token_usage = TokenUsage()
+        # Accumulate in a slotted counter; TokenUsage is built once after the stream ends
+        tokens = TokenCounter()
         processed_message_ids = set()
 
         async with ClaudeSDKClient(options=options) as client:
@@ -108,42 +123,36 @@ class ClaudeAgentSDKAgent:
                 if isinstance(message, ResultMessage) and message.result:
                     response_text = message.result
                 usage = getattr(message, "usage", None)
-                inp, out = 0, 0
+                inp, out, cached = 0, 0, 0
                 if usage:
                     inp = usage.get("input_tokens", 0) or 0
                     out = usage.get("output_tokens", 0) or 0
+                    cached = usage.get("cache_read_input_tokens", 0) or 0
 
                     if isinstance(message, ResultMessage):
                         # ResultMessage contains cumulative usage; overwrite total
-                        token_usage = TokenUsage(
-                            input_tokens=inp,
-                            output_tokens=out,
-                            total_tokens=inp + out,
-                        )
+                        tokens = TokenCounter(inp, out, inp + out, cached)
                     elif isinstance(message, AssistantMessage):
                         # Deduplicate AssistantMessage usage by ID (charge once per step)
                         msg_id = getattr(message, "id", None)
                         if msg_id not in processed_message_ids:
-                            token_usage = TokenUsage(
-                                input_tokens=token_usage.input_tokens + inp,
-                                output_tokens=token_usage.output_tokens + out,
-                                total_tokens=token_usage.total_tokens + inp + out,
-                            )
+                            tokens.add(inp, out, inp + out, cached)
                             if msg_id:
                                 processed_message_ids.add(msg_id)
-                logger.debug(
+                # Lazy: message rendering is skipped entirely unless a DEBUG sink is attached
+                logger.opt(lazy=True).debug(
                     "[{msg_type}] tokens=({input_tokens}in/{output_tokens}out) {content}",
-                    msg_type=_msg_type(message),
-                    content=_msg_content(message),
-                    input_tokens=inp,
-                    output_tokens=out,
-                    total_tokens=(inp + out),
+                    msg_type=lambda m=message: _msg_type(m),
+                    content=lambda m=message: _msg_content(m),
+                    input_tokens=lambda n=inp: n,
+                    output_tokens=lambda n=out: n,
+                    total_tokens=lambda n=inp + out: n,
                 )
 
         elapsed = round(time.perf_counter() - start, 3)
         return AgentResult(
             response=response_text,
-            token_usage=token_usage,
+            token_usage=tokens.to_usage(),
             time_taken=elapsed,
         )
 
@@ -6,6 +6,7 @@ from deepagents import create_deep_agent
 from deepagents.backends import FilesystemBackend
 from langchain.chat_models import init_chat_model
 
+from agents.langchain.utils import run_config, text_content
 from agents.types import AgentResult, TokenUsage
 from tasks.types import Task
 
@@ -23,18 +24,14 @@ class DeepAgent:
         messages.append({"role": "user", "content": task.prompt})
 
         start = time.perf_counter()
-        result = self._agent.invoke({"messages": messages})
+        result = self._agent.invoke({"messages": messages}, config=run_config(task.max_turns))
         elapsed = round(time.perf_counter() - start, 3)
 
         last_msg = result["messages"][-1]
         usage = getattr(last_msg, "usage_metadata", None) or {}
 
-        content = last_msg.content
-        if isinstance(content, list):
-            content = "".join(block.get("text", "") if isinstance(block, dict) else str(block) for block in content)
-
         return AgentResult(
-            response=content,
+            response=text_content(last_msg.content),
             token_usage=TokenUsage(
                 input_tokens=usage.get("input_tokens", 0),
                 output_tokens=usage.get("output_tokens", 0),
@@ -1,15 +1,19 @@
 import os
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from langchain.agents import create_agent
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
 from langchain_core.tools import BaseTool
 from loguru import logger
 
-from agents.types import AgentResult, TokenUsage
+from agents.langchain.utils import run_config, text_content
+from agents.types import AgentResult, TokenCounter
 from tasks.types import Task
 
+if TYPE_CHECKING:
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+
 
 def _msg_type(msg: Any) -> str:
     if isinstance(msg, AIMessage):
@@ -24,9 +28,7 @@ def _msg_type(msg: Any) -> str:
 
 
 def _msg_content(msg: Any) -> str:
-    content = msg.content
-    if isinstance(content, list):
-        content = "".join(block.get("text", "") if isinstance(block, dict) else str(block) for block in content)
+    content = text_content(msg.content)
     parts = [content] if content else []
     if isinstance(msg, AIMessage) and msg.tool_calls:
         for tc in msg.tool_calls:
@@ -48,54 +50,63 @@ class ReactAgent:
         messages.append({"role": "user", "content": task.prompt})
 
         start = time.perf_counter()
-        result = await self._agent.ainvoke({"messages": messages})
+        result = await self._agent.ainvoke({"messages": messages}, config=run_config(task.max_turns))
         elapsed = round(time.perf_counter() - start, 3)
 
         messages = result["messages"]
-        input_tokens = 0
-        output_tokens = 0
-        total_tokens = 0
+        tokens = TokenCounter()
         for msg in messages:
             usage = getattr(msg, "usage_metadata", None) or {}
-            input_tokens += usage.get("input_tokens", 0)
-            output_tokens += usage.get("output_tokens", 0)
-            total_tokens += usage.get("total_tokens", 0)
-            logger.debug(
+            tokens.add(
+                usage.get("input_tokens", 0),
+                usage.get("output_tokens", 0),
+                usage.get("total_tokens", 0),
+                (usage.get("input_token_details") or {}).get("cache_read", 0),
+            )
+            # Lazy: message rendering is skipped entirely unless a DEBUG sink is attached
+            logger.opt(lazy=True).debug(
                 "[{msg_type}] tokens=({input_tokens}in/{output_tokens}out) {content}",
-                msg_type=_msg_type(msg),
-                content=_msg_content(msg),
-                input_tokens=usage.get("input_tokens"),
-                output_tokens=usage.get("output_tokens"),
-                total_tokens=usage.get("total_tokens"),
+                msg_type=lambda m=msg: _msg_type(m),
+                content=lambda m=msg: _msg_content(m),
+                input_tokens=lambda u=usage: u.get("input_tokens"),
+                output_tokens=lambda u=usage: u.get("output_tokens"),
+                total_tokens=lambda u=usage: u.get("total_tokens"),
             )
 
-        last_msg = messages[-1]
-        content = last_msg.content
-        if isinstance(content, list):
-            content = "".join(block.get("text", "") if isinstance(block, dict) else str(block) for block in content)
-
         return AgentResult(
-            response=content,
-            token_usage=TokenUsage(
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                total_tokens=total_tokens,
-            ),
+            response=text_content(messages[-1].content),
+            token_usage=tokens.to_usage(),
             time_taken=elapsed,
         )
 
 
-async def get_agent(mcp_server: dict[str, Any] | None = None) -> ReactAgent:
-    tools: list[BaseTool] = []
-    if mcp_server:
-        from langchain_mcp_adapters.client import MultiServerMCPClient, StreamableHttpConnection
+# MCP clients hold no open connections (a session is opened per tool call over the shared
+# httpx pool), so one client per server URL is reused across get_agent calls.
+_mcp_clients: dict[str, "MultiServerMCPClient"] = {}
+
 
+def _mcp_client(mcp_server: dict[str, Any]) -> "MultiServerMCPClient":
+    from langchain_mcp_adapters.client import MultiServerMCPClient, StreamableHttpConnection
+
+    from agents._http import pooled_httpx_client_factory
+
+    client = _mcp_clients.get(mcp_server["url"])
+    if client is None:
         connection: StreamableHttpConnection = {
             "transport": mcp_server["transport"],
             "url": mcp_server["url"],
+            "httpx_client_factory": pooled_httpx_client_factory,
         }
-        client = MultiServerMCPClient({"world": connection})
-        tools = await client.get_tools()
+        client = _mcp_clients[mcp_server["url"]] = MultiServerMCPClient({"world": connection})
+    return client
+
+
+async def get_agent(mcp_server: dict[str, Any] | None = None) -> ReactAgent:
+    tools: list[BaseTool] = []
+    if mcp_server:
+        # Tools are listed fresh each time: the world behind a URL can change between runs.
+        # Discovery runs on the shared pool, so its connection is kept warm for the first tool call.
+        tools = await _mcp_client(mcp_server).get_tools()
     return ReactAgent(tools=tools)
 
 
@@ -0,0 +1,13 @@
+from typing import Any
+
+
+def text_content(content: str | list[Any]) -> str:
+    """Flatten message content to text; some providers (e.g. Gemini) return a list of content blocks."""
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") if isinstance(block, dict) else str(block) for block in content)
+
+
+def run_config(max_turns: int | None) -> dict[str, Any] | None:
+    """Graph config for a per-task turn cap; each turn is a model step plus a tool step."""
+    return {"recursion_limit": 2 * max_turns + 1} if max_turns else None
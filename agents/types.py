@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from pydantic import BaseModel
 
 
@@ -5,9 +7,49 @@ class TokenUsage(BaseModel):
     input_tokens: int = 0
     output_tokens: int = 0
     total_tokens: int = 0
+    cache_read_input_tokens: int = 0  # input tokens served from the prompt cache
+
+
+@dataclass(slots=True)
+class TokenCounter:
+    """Mutable token tally for accumulation loops; convert to TokenUsage once at the end."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    cache_read_input_tokens: int = 0
+
+    def add(self, input_tokens: int, output_tokens: int, total_tokens: int, cache_read_input_tokens: int = 0) -> None:
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+        self.total_tokens += total_tokens
+        self.cache_read_input_tokens += cache_read_input_tokens
+
+    def to_usage(self) -> TokenUsage:
+        return TokenUsage(
+            input_tokens=self.input_tokens,
+            output_tokens=self.output_tokens,
+            total_tokens=self.total_tokens,
+            cache_read_input_tokens=self.cache_read_input_tokens,
+        )
 
 
 class AgentResult(BaseModel):
     response: str
     token_usage: TokenUsage
     time_taken: float  # seconds
+
+
+class RunResult(BaseModel):
+    """One task's agent run as saved to <run_dir>/<task_id>.json."""
+
+    task_id: str
+    domain: str
+    prompt: str
+    gold_response: str
+    rubric: list[str]
+    agent_response: str
+    token_usage: TokenUsage
+    time_taken: float
+    status: str | None = None  # "failed" when the agent raised
+    error: str | None = None
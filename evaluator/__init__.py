@@ -1,8 +1,9 @@
-from .types import EvalResult, FinalSummary, JudgmentResult, TaskGrade
+from .types import EvalResult, FinalSummary, GradesFile, JudgmentResult, TaskGrade
 
 __all__ = [
     "EvalResult",
     "JudgmentResult",
     "TaskGrade",
+    "GradesFile",
     "FinalSummary",
 ]
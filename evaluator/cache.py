@@ -0,0 +1,46 @@
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+
+from .types import JudgmentResult
+
+
+class JudgeCache:
+    """On-disk cache of judgments keyed by a hash of everything the judge sees.
+
+    Lookups and writes are batched per task and are safe to run in worker threads (asyncio.to_thread),
+    so the blocking sqlite calls stay off the event loop.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()  # one connection shared by worker threads
+        self._conn.execute("CREATE TABLE IF NOT EXISTS judgments (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    @staticmethod
+    def key(model: str, version: str, criterion: str, question: str, response: str, reference: str) -> str:
+        """version identifies the judge prompt and output schema, so changing either retires old verdicts."""
+        h = hashlib.blake2b(digest_size=32)
+        for part in (model, version, criterion, question, response, reference):
+            h.update(part.encode())
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def get_many(self, keys: list[str]) -> list[JudgmentResult | None]:
+        """Look up several keys in one query; misses come back as None, in key order."""
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, value FROM judgments WHERE key IN ({placeholders})", keys
+            ).fetchall()
+        found = dict(rows)
+        return [JudgmentResult.model_validate_json(found[k]) if k in found else None for k in keys]
+
+    def put_many(self, items: list[tuple[str, JudgmentResult]]) -> None:
+        """Store several judgments in a single transaction."""
+        rows = [(key, judgment.model_dump_json()) for key, judgment in items]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO judgments (key, value) VALUES (?, ?)", rows)
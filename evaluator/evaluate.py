@@ -1,6 +1,11 @@
+import asyncio
+import functools
+import hashlib
 import json
 import os
 from pathlib import Path
+from typing import Any
+from weakref import WeakKeyDictionary
 
 from dotenv import load_dotenv
 
@@ -10,28 +15,38 @@ from langchain.chat_models import init_chat_model  # noqa: E402
 from loguru import logger  # noqa: E402
 from pydantic import BaseModel  # noqa: E402
 
-from agents.types import TokenUsage  # noqa: E402
+from agents.types import RunResult, TokenCounter, TokenUsage  # noqa: E402
 
-from .types import EvalResult, FinalSummary, JudgmentResult, TaskGrade  # noqa: E402
+from .cache import JudgeCache  # noqa: E402
+from .types import EvalResult, FinalSummary, GradesFile, JudgmentResult, TaskGrade  # noqa: E402
 
-JUDGE_PROMPT = """\
-You are an expert evaluator. Judge whether the agent's response satisfies the following criterion.
+JUDGE_INSTRUCTIONS = """\
+You are an expert evaluator. You will be given a question asked to an agent, the agent's response, \
+a reference (gold) answer, and one or more criteria. Judge whether the agent's response satisfies each criterion.
 
-Criterion: {criterion}
-
-Question asked to the agent:
-{question}
+For each criterion, return score=true if it is satisfied, false otherwise, and explain your reasoning briefly. \
+When the criteria are numbered, return one judgment per criterion, in order, with index set to the criterion's number.
+"""
 
-Agent's response:
-{response}
 
-Reference (gold) answer:
-{reference}
+def _judge_context(question: str, response: str, reference: str) -> str:
+    """Per-task judge context, built with an f-string rather than re-parsing a .format() template."""
+    return (
+        f"Question asked to the agent:\n{question}\n\n"
+        f"Agent's response:\n{response}\n\n"
+        f"Reference (gold) answer:\n{reference}\n"
+    )
 
-Return score=true if the criterion is satisfied, false otherwise. Explain your reasoning briefly.
-"""
 
 _JUDGE_MODEL = os.getenv("JUDGE_MODEL", "anthropic:claude-haiku-4-5-20251001")
+# Judge output is a short verdict per criterion; batched calls need room for one per rubric line.
+_JUDGE_MAX_TOKENS = int(os.getenv("JUDGE_MAX_TOKENS", "2048"))
+# Caps both judge calls in flight and tasks judged at once by evaluate_run
+JUDGE_CONCURRENCY = int(os.getenv("JUDGE_CONCURRENCY", "16"))
+_JUDGE_CACHE_PATH = os.getenv("JUDGE_CACHE_PATH", "~/.cache/ga-bench/judge.sqlite3")  # empty disables the cache
+
+# Anthropic only caches prefixes explicitly marked with cache_control; other providers cache implicitly.
+_CACHE_CONTROL = {"cache_control": {"type": "ephemeral"}} if _JUDGE_MODEL.startswith("anthropic:") else {}
 
 
 class _JudgeOutput(BaseModel):
@@ -39,125 +54,257 @@ class _JudgeOutput(BaseModel):
     score: bool
 
 
-def llm_as_judge(
+class _IndexedJudgeOutput(_JudgeOutput):
+    index: int  # 1-based position of the criterion in the prompt
+
+
+class _JudgeBatch(BaseModel):
+    judgments: list[_IndexedJudgeOutput]
+
+
+# Bump for judging changes the hash below can't see (e.g. how criteria are batched), so cached verdicts
+# produced the old way stop being served.
+_CACHE_VERSION = 1
+# Part of every cache key: instructions and output schemas are hashed in, so editing them retires old verdicts.
+_JUDGE_VERSION = hashlib.blake2b(
+    json.dumps(
+        [_CACHE_VERSION, JUDGE_INSTRUCTIONS, _JudgeOutput.model_json_schema(), _JudgeBatch.model_json_schema()],
+        sort_keys=True,
+    ).encode(),
+    digest_size=16,
+).hexdigest()
+
+
+@functools.lru_cache(maxsize=4)
+def _judge_model(model_id: str, schema: type[BaseModel]) -> Any:
+    """Build the structured-output judge once per (model, schema) instead of on every call.
+
+    Temperature 0 keeps verdicts deterministic, which is also what makes cached verdicts reusable.
+    """
+    model = init_chat_model(model_id, temperature=0, max_tokens=_JUDGE_MAX_TOKENS)
+    return model.with_structured_output(schema, include_raw=True)
+
+
+@functools.cache
+def _judge_cache() -> JudgeCache | None:
+    return JudgeCache(_JUDGE_CACHE_PATH) if _JUDGE_CACHE_PATH else None
+
+
+# One per event loop: a semaphore is bound to the loop that first waits on it, and each
+# asyncio.run() (e.g. evaluate_run called twice in one process) starts a new loop.
+_judge_semaphores: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = WeakKeyDictionary()
+
+
+def _judge_semaphore() -> asyncio.Semaphore:
+    """Cap on in-flight judge calls for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _judge_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _judge_semaphores[loop] = asyncio.Semaphore(JUDGE_CONCURRENCY)
+    return semaphore
+
+
+def _judge_messages(context: str, criteria: str) -> list[dict]:
+    """Build judge messages as static instructions + per-task context (both cacheable) + criteria."""
+    return [
+        {"role": "system", "content": [{"type": "text", "text": JUDGE_INSTRUCTIONS, **_CACHE_CONTROL}]},
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": context, **_CACHE_CONTROL},
+                {"type": "text", "text": criteria},
+            ],
+        },
+    ]
+
+
+def _usage(raw: Any) -> TokenUsage:
+    usage = getattr(raw, "usage_metadata", None) or {}
+    return TokenUsage(
+        input_tokens=usage.get("input_tokens", 0),
+        output_tokens=usage.get("output_tokens", 0),
+        total_tokens=usage.get("total_tokens", 0),
+        cache_read_input_tokens=(usage.get("input_token_details") or {}).get("cache_read", 0),
+    )
+
+
+def _log_judgment(judgment: JudgmentResult) -> JudgmentResult:
+    mark = "PASS" if judgment.score else "FAIL"
+    logger.info("[{}] {}", mark, judgment.criterion[:80])
+    return judgment
+
+
+async def _judge_criterion(criterion: str, context: str) -> tuple[JudgmentResult, TokenUsage]:
+    model = _judge_model(_JUDGE_MODEL, _JudgeOutput)
+    async with _judge_semaphore():
+        result: dict = await model.ainvoke(_judge_messages(context, f"Criterion: {criterion}"))  # type: ignore[assignment]
+    parsed: _JudgeOutput = result["parsed"]
+    judgment = JudgmentResult(criterion=criterion, score=parsed.score, comment=parsed.reasoning)
+    return _log_judgment(judgment), _usage(result["raw"])
+
+
+async def _judge_batch(rubric: list[str], context: str) -> tuple[list[JudgmentResult] | None, TokenUsage]:
+    """Judge all criteria in one call. Judgments are None if they don't line up with the rubric."""
+    model = _judge_model(_JUDGE_MODEL, _JudgeBatch)
+    criteria = "Criteria:\n" + "\n".join(f"{i}. {criterion}" for i, criterion in enumerate(rubric, 1))
+    async with _judge_semaphore():
+        result: dict = await model.ainvoke(_judge_messages(context, criteria))  # type: ignore[assignment]
+    usage = _usage(result["raw"])
+    parsed: _JudgeBatch | None = result["parsed"]
+    if parsed is None:
+        return None, usage
+    by_index = {j.index: j for j in parsed.judgments}
+    if len(parsed.judgments) != len(rubric) or set(by_index) != set(range(1, len(rubric) + 1)):
+        return None, usage
+    judgments = [
+        _log_judgment(JudgmentResult(criterion=criterion, score=by_index[i].score, comment=by_index[i].reasoning))
+        for i, criterion in enumerate(rubric, 1)
+    ]
+    return judgments, usage
+
+
+def _sum_usage(usages: list[TokenUsage]) -> TokenUsage:
+    tokens = TokenCounter()
+    for u in usages:
+        tokens.add(u.input_tokens, u.output_tokens, u.total_tokens, u.cache_read_input_tokens)
+    return tokens.to_usage()
+
+
+async def llm_as_judge(
     prompt: str,
     agent_output: str,
     rubric: list[str],
     gold_response: str = "",
 ) -> EvalResult:
-    """Evaluate agent_output against each rubric criterion using an LLM judge."""
-    model = init_chat_model(_JUDGE_MODEL).with_structured_output(_JudgeOutput, include_raw=True)
-
-    judgments = []
-    for criterion in rubric:
-        logger.debug("Judging criterion: {}", criterion[:80])
-        content = JUDGE_PROMPT.format(
-            criterion=criterion,
-            question=prompt,
-            response=agent_output,
-            reference=gold_response,
-        )
-        result: dict = model.invoke([{"role": "user", "content": content}])  # type: ignore[assignment]
-        parsed: _JudgeOutput = result["parsed"]
-        mark = "PASS" if parsed.score else "FAIL"
-        logger.info("[{}] {}", mark, criterion[:80])
-        judgments.append(
-            JudgmentResult(
-                criterion=criterion,
-                score=parsed.score,
-                comment=parsed.reasoning,
-            )
-        )
+    """Evaluate agent_output against each rubric criterion using an LLM judge.
+
+    All criteria are judged in a single call so the shared question/response/reference
+    context is sent once. If the batched judgments don't map one-to-one onto the rubric,
+    falls back to judging each criterion separately (concurrently). Judgments are cached
+    on disk (JUDGE_CACHE_PATH), so only criteria never seen with this exact input hit the model.
+    """
+    cache = _judge_cache()
+    keys = [JudgeCache.key(_JUDGE_MODEL, _JUDGE_VERSION, c, prompt, agent_output, gold_response) for c in rubric]
+    # sqlite calls run in a worker thread so a commit doesn't stall every other in-flight judge
+    cached = await asyncio.to_thread(cache.get_many, keys) if cache else [None] * len(keys)
+    pending = [c for c, hit in zip(rubric, cached, strict=True) if hit is None]
+    for hit in cached:
+        if hit is not None:
+            _log_judgment(hit)
+
+    usages: list[TokenUsage] = []
+    fresh: list[JudgmentResult] = []
+    if pending:
+        context = _judge_context(prompt, agent_output, gold_response)
+        batch, batch_usage = await _judge_batch(pending, context)
+        usages.append(batch_usage)
+        if batch is None:
+            logger.warning("Batched judgments did not match the rubric; judging criteria one by one")
+            results = await asyncio.gather(*(_judge_criterion(criterion, context) for criterion in pending))
+            batch = [judgment for judgment, _ in results]
+            usages.extend(usage for _, usage in results)
+        fresh = batch
+
+    fresh_iter = iter(fresh)
+    judgments = [hit if hit is not None else next(fresh_iter) for hit in cached]
+    if cache and fresh:
+        items = [(key, judgment) for key, hit, judgment in zip(keys, cached, judgments, strict=True) if hit is None]
+        await asyncio.to_thread(cache.put_many, items)
 
     return EvalResult(
         judgments=judgments,
         passed=sum(1 for j in judgments if j.score),
         total=len(judgments),
+        token_usage=_sum_usage(usages),
     )
 
 
-def evaluate_run(run_id: str, output_base: str = "output") -> None:
-    """Evaluate all tasks in a run, then write grades.json and final.json."""
-    run_dir = Path(output_base) / run_id
-    if not run_dir.exists():
-        raise FileNotFoundError(f"Run directory not found: {run_dir}")
+async def evaluate_task(task_result: RunResult, run_dir: Path, force: bool = False) -> TaskGrade:
+    """Judge one completed agent run and save its <task_id>.eval.json next to it.
 
-    _SKIP = {"manifest.json", "grades.json", "final.json"}
-    task_files = sorted(f for f in run_dir.glob("*.json") if f.name not in _SKIP and not f.name.endswith(".eval.json"))
+    An existing .eval.json is reused unless force is set.
+    """
+    eval_file = run_dir / f"{task_result.task_id}.eval.json"
 
-    logger.info("Evaluating run: {}", run_id)
-    logger.info("Tasks to evaluate: {}", len(task_files))
+    if not force and eval_file.exists():
+        logger.info("[{}] {}: already evaluated, reusing {}", task_result.domain, task_result.task_id, eval_file.name)
+        eval_result = EvalResult.model_validate_json(await asyncio.to_thread(eval_file.read_bytes))
+    else:
+        logger.info("[{}] Judging: {}", task_result.domain, task_result.prompt[:80])
+        eval_result = await llm_as_judge(
+            prompt=task_result.prompt,
+            agent_output=task_result.agent_response,
+            rubric=task_result.rubric,
+            gold_response=task_result.gold_response,
+        )
 
-    grades: list[TaskGrade] = []
+        # Save per-task eval as soon as it's judged, off the event loop
+        payload = {"task_id": task_result.task_id, **eval_result.model_dump()}
+        await asyncio.to_thread(eval_file.write_bytes, json.dumps(payload, indent=2).encode())
 
-    for i, task_file in enumerate(task_files, 1):
-        task_result = json.loads(task_file.read_text())
-        logger.info("Task {}/{} [{}]: {}", i, len(task_files), task_result["domain"], task_result["prompt"][:80])
+    score = eval_result.passed / eval_result.total if eval_result.total else 0.0
+    logger.success(
+        "[{}] {} scored {:.0%} ({}/{})",
+        task_result.domain,
+        task_result.task_id,
+        score,
+        eval_result.passed,
+        eval_result.total,
+    )
+    return TaskGrade(
+        task_id=task_result.task_id,
+        domain=task_result.domain,
+        prompt=task_result.prompt,
+        score=score,
+        passed=eval_result.passed,
+        total=eval_result.total,
+        token_usage=task_result.token_usage,
+        time_taken=task_result.time_taken,
+    )
 
-        eval_result = llm_as_judge(
-            prompt=task_result["prompt"],
-            agent_output=task_result["agent_response"],
-            rubric=task_result["rubric"],
-            gold_response=task_result["gold_response"],
-        )
 
-        # Save per-task eval
-        eval_file = run_dir / f"{task_result['task_id']}.eval.json"
-        eval_file.write_text(
-            json.dumps(
-                {
-                    "task_id": task_result["task_id"],
-                    **eval_result.model_dump(),
-                },
-                indent=2,
-            )
-        )
+async def _evaluate_task_file(run_dir: Path, task_file: Path, force: bool = False) -> TaskGrade:
+    task_result = RunResult.model_validate_json(await asyncio.to_thread(task_file.read_bytes))
+    return await evaluate_task(task_result, run_dir, force)
 
-        score = eval_result.passed / eval_result.total if eval_result.total else 0.0
-        usage = TokenUsage(**task_result["token_usage"])
-        grades.append(
-            TaskGrade(
-                task_id=task_result["task_id"],
-                domain=task_result["domain"],
-                prompt=task_result["prompt"],
-                score=score,
-                passed=eval_result.passed,
-                total=eval_result.total,
-                token_usage=usage,
-                time_taken=task_result["time_taken"],
-            )
-        )
-        logger.success("Task scored {:.0%} ({}/{})", score, eval_result.passed, eval_result.total)
 
+def write_summary(run_id: str, run_dir: Path, grades: list[TaskGrade]) -> FinalSummary:
+    """Write grades.json and final.json for a run and log the headline numbers."""
     # grades.json
     grades_file = run_dir / "grades.json"
-    grades_file.write_text(
-        json.dumps(
-            {"run_id": run_id, "grades": [g.model_dump() for g in grades]},
-            indent=2,
-        )
-    )
+    grades_file.write_text(GradesFile(run_id=run_id, grades=grades).model_dump_json(indent=2))
 
-    # final.json
+    # final.json — aggregate everything in one pass over grades
     n = len(grades)
-    total_input = sum(g.token_usage.input_tokens for g in grades)
-    total_output = sum(g.token_usage.output_tokens for g in grades)
-    total_tokens = sum(g.token_usage.total_tokens for g in grades)
+    total_input = total_output = total_tokens = total_cache_read = total_passed = total_criteria = 0
+    total_score = total_time = 0.0
+    for g in grades:
+        usage = g.token_usage
+        total_input += usage.input_tokens
+        total_output += usage.output_tokens
+        total_tokens += usage.total_tokens
+        total_cache_read += usage.cache_read_input_tokens
+        total_passed += g.passed
+        total_criteria += g.total
+        total_score += g.score
+        total_time += g.time_taken
 
     final = FinalSummary(
         run_id=run_id,
         num_tasks=n,
-        avg_score=round(sum(g.score for g in grades) / n, 4) if n else 0.0,
-        avg_time_taken=round(sum(g.time_taken for g in grades) / n, 3) if n else 0.0,
+        avg_score=round(total_score / n, 4) if n else 0.0,
+        avg_time_taken=round(total_time / n, 3) if n else 0.0,
         total_token_usage=TokenUsage(
             input_tokens=total_input,
             output_tokens=total_output,
             total_tokens=total_tokens,
+            cache_read_input_tokens=total_cache_read,
         ),
         avg_token_usage=TokenUsage(
             input_tokens=round(total_input / n) if n else 0,
             output_tokens=round(total_output / n) if n else 0,
             total_tokens=round(total_tokens / n) if n else 0,
+            cache_read_input_tokens=round(total_cache_read / n) if n else 0,
         ),
     )
     (run_dir / "final.json").write_text(final.model_dump_json(indent=2))
@@ -165,18 +312,47 @@ def evaluate_run(run_id: str, output_base: str = "output") -> None:
     logger.success(
         "Score: {:.0%}  ({}/{} criteria passed)",
         final.avg_score,
-        sum(g.passed for g in grades),
-        sum(g.total for g in grades),
+        total_passed,
+        total_criteria,
     )
     logger.info("Tokens: {} total  ({} in / {} out)", total_tokens, total_input, total_output)
     logger.info("Time:   {}s avg per task", final.avg_time_taken)
     logger.info("Results: {}/", run_dir)
+    return final
+
+
+async def evaluate_run(run_id: str, output_base: str = "output", force: bool = False) -> None:
+    """Evaluate all tasks in a run concurrently, then write grades.json and final.json.
+
+    Tasks that already have a .eval.json are not judged again unless force is set.
+    """
+    run_dir = Path(output_base) / run_id
+    if not run_dir.exists():
+        raise FileNotFoundError(f"Run directory not found: {run_dir}")
+
+    _SKIP = {"manifest.json", "grades.json", "final.json"}
+    task_files = sorted(f for f in run_dir.glob("*.json") if f.name not in _SKIP and not f.name.endswith(".eval.json"))
+
+    logger.info("Evaluating run: {}", run_id)
+    logger.info("Tasks to evaluate: {}", len(task_files))
+
+    # Fan out across tasks, but only admit JUDGE_CONCURRENCY at a time so large runs don't open
+    # every task file and queue every judge request up front. gather keeps grades in file order.
+    sem = asyncio.Semaphore(JUDGE_CONCURRENCY)
+
+    async def _one(task_file: Path) -> TaskGrade:
+        async with sem:
+            return await _evaluate_task_file(run_dir, task_file, force)
+
+    grades: list[TaskGrade] = list(await asyncio.gather(*(_one(f) for f in task_files)))
+    write_summary(run_id, run_dir, grades)
 
 
 if __name__ == "__main__":
     import sys
 
-    if len(sys.argv) < 2:
-        print("Usage: python -m evaluator.evaluate <run_id>")
+    args = [a for a in sys.argv[1:] if a != "--force"]
+    if len(args) != 1:
+        print("Usage: python -m evaluator.evaluate <run_id> [--force]")
         sys.exit(1)
-    evaluate_run(sys.argv[1])
+    asyncio.run(evaluate_run(args[0], force="--force" in sys.argv[1:]))
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from agents.types import TokenUsage
 
@@ -13,6 +13,7 @@ class EvalResult(BaseModel):
     judgments: list[JudgmentResult]
     passed: int
     total: int
+    token_usage: TokenUsage = Field(default_factory=TokenUsage)  # judge tokens spent on this task
 
 
 class TaskGrade(BaseModel):
@@ -26,6 +27,11 @@ class TaskGrade(BaseModel):
     time_taken: float
 
 
+class GradesFile(BaseModel):
+    run_id: str
+    grades: list[TaskGrade]
+
+
 class FinalSummary(BaseModel):
     run_id: str
     num_tasks: int
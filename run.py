@@ -1,22 +1,23 @@
 import asyncio
-import json
 import sys
 import traceback
 import uuid
 from datetime import UTC, datetime
 from enum import StrEnum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import typer
 from dotenv import load_dotenv
 from loguru import logger
 
-load_dotenv()  # Load .env before importing modules that may read env vars at import time
-
-from agents.base import Agent  # noqa: E402
-from tasks import load_tasks  # noqa: E402
-from tasks.types import Task  # noqa: E402
+# Project modules pull in pydantic and the agent SDKs, so they're imported only once a run
+# starts (after load_dotenv) — `--help` and argument errors stay fast.
+if TYPE_CHECKING:
+    from agents.base import Agent
+    from agents.types import RunResult
+    from evaluator.types import TaskGrade
+    from tasks.types import Task
 
 app = typer.Typer()
 
@@ -29,7 +30,7 @@ class AgentName(StrEnum):
     claude_agent_sdk = "claude-agent-sdk"
 
 
-async def _get_agent(name: AgentName, mcp_server: dict[str, Any] | None = None, run_dir: Path | None = None) -> Agent:
+async def _get_agent(name: AgentName, mcp_server: dict[str, Any] | None = None, run_dir: Path | None = None) -> "Agent":
     logger.info("Loading agent: {}", name.value)
     if name == AgentName.langchain_react:
         from agents.langchain.react import get_agent
@@ -47,7 +48,9 @@ async def _get_agent(name: AgentName, mcp_server: dict[str, Any] | None = None,
     return agent
 
 
-async def run_task(agent: Agent, task: Task, system_prompt: str = "") -> dict:
+async def run_task(agent: "Agent", task: "Task", system_prompt: str = "") -> "RunResult":
+    from agents.types import RunResult
+
     logger.info("[{}] Running task: {}", task.domain, task.prompt[:80])
     result = await agent.run(task, system_prompt=system_prompt)
     logger.success(
@@ -56,16 +59,28 @@ async def run_task(agent: Agent, task: Task, system_prompt: str = "") -> dict:
         result.token_usage.total_tokens,
         result.time_taken,
     )
-    return {
-        "task_id": task.id,
-        "domain": task.domain,
-        "prompt": task.prompt,
-        "gold_response": task.gold_response,
-        "rubric": [r.criteria for r in task.rubric],
-        "agent_response": result.response,
-        "token_usage": result.token_usage.model_dump(),
-        "time_taken": result.time_taken,
-    }
+    return RunResult(
+        task_id=task.id,
+        domain=task.domain,
+        prompt=task.prompt,
+        gold_response=task.gold_response,
+        rubric=task.criteria,
+        agent_response=result.response,
+        token_usage=result.token_usage,
+        time_taken=result.time_taken,
+    )
+
+
+async def _judge_worker(queue: "asyncio.Queue[RunResult | None]", run_dir: Path, grades: "list[TaskGrade]") -> None:
+    from evaluator.evaluate import evaluate_task
+
+    while (result := await queue.get()) is not None:
+        # A failed judgment must not escape: it would cancel the TaskGroup and every agent run in flight
+        try:
+            grades.append(await evaluate_task(result, run_dir))
+        except Exception as e:
+            logger.error("Judging failed for {}: {} (re-run with `python -m evaluator.evaluate`)", result.task_id, e)
+            logger.debug("Traceback: {}", traceback.format_exc())
 
 
 async def _main(
@@ -75,7 +90,14 @@ async def _main(
     system_prompt: str,
     world: str | None,
     task_id: str | None,
+    evaluate: bool = False,
+    concurrency: int = 1,
 ):
+    from pydantic_core import to_json
+
+    from agents.types import RunResult, TokenUsage
+    from tasks import load_tasks
+
     run_id = str(uuid.uuid4())
     run_dir = Path(output_base) / run_id
     run_dir.mkdir(parents=True)
@@ -109,42 +131,73 @@ async def _main(
                 return
         logger.info("Tasks:   {} loaded from {}", len(tasks), tasks_dir)
 
-        results = []
-        for i, task in enumerate(tasks, 1):
-            logger.info("Task {}/{}", i, len(tasks))
-            trace_file = run_dir / f"{task.id}.traces"
-            sink_id = logger.add(
-                trace_file,
-                level="DEBUG",
-                format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level:<8} | {name}:{function}:{line} | {message} | extra={extra}",  # noqa: E501
-            )
-            result: dict[str, Any] = {}
-            try:
-                try:
-                    result = await run_task(agent, task, system_prompt=system_prompt)
-                except Exception as e:
-                    logger.error("Task failed: {}", e)
-                    logger.debug("Traceback: {}", traceback.format_exc())
-                    result = {
-                        "task_id": task.id,
-                        "domain": task.domain,
-                        "prompt": task.prompt,
-                        "gold_response": task.gold_response,
-                        "rubric": [r.criteria for r in task.rubric],
-                        "agent_response": f"Error: {e}",
-                        "token_usage": {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0},
-                        "time_taken": 0.0,
-                        "status": "failed",
-                        "error": str(e),
-                    }
-            finally:
-                logger.remove(sink_id)
-            logger.debug("Response: {}", result["agent_response"][:120])
-
+        grades: list[TaskGrade] = []
+        # When evaluating, finished agent runs stream into a queue drained by judge workers,
+        # so judging overlaps with the remaining agent runs instead of waiting for all of them.
+        judge_queue: asyncio.Queue[RunResult | None] = asyncio.Queue()
+        num_judges = 0
+        if evaluate:
+            from evaluator.evaluate import JUDGE_CONCURRENCY
+
+            num_judges = JUDGE_CONCURRENCY
+        # Tasks against a world share its state, so the default of 1 keeps them serial.
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _run_one(i: int, task: "Task") -> str:
+            async with semaphore:
+                with logger.contextualize(task_id=task.id):
+                    logger.info("Task {}/{}", i, len(tasks))
+                    trace_file = run_dir / f"{task.id}.traces"
+                    # Only this task's records go to its trace file, even when other tasks run alongside it
+                    sink_id = logger.add(
+                        trace_file,
+                        level="DEBUG",
+                        format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level:<8} | {name}:{function}:{line} | {message} | extra={extra}",  # noqa: E501
+                        filter=lambda record: record["extra"].get("task_id") == task.id,
+                    )
+                    try:
+                        try:
+                            result = await run_task(agent, task, system_prompt=system_prompt)
+                        except Exception as e:
+                            logger.error("Task failed: {}", e)
+                            logger.debug("Traceback: {}", traceback.format_exc())
+                            result = RunResult(
+                                task_id=task.id,
+                                domain=task.domain,
+                                prompt=task.prompt,
+                                gold_response=task.gold_response,
+                                rubric=task.criteria,
+                                agent_response=f"Error: {e}",
+                                token_usage=TokenUsage(),
+                                time_taken=0.0,
+                                status="failed",
+                                error=str(e),
+                            )
+                    finally:
+                        logger.remove(sink_id)
+                    logger.debug("Response: {}", result.agent_response[:120])
+
+            # Write off the event loop so other in-flight tasks aren't stalled on disk I/O
             task_file = run_dir / f"{task.id}.json"
-            task_file.write_text(json.dumps(result, indent=2))
-            results.append(result)
+            await asyncio.to_thread(task_file.write_bytes, result.model_dump_json(indent=2, exclude_none=True).encode())
+            if evaluate:
+                judge_queue.put_nowait(result)
+            # Only the id is kept for the manifest; the full result is already on disk
+            return result.task_id
+
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(num_judges):
+                tg.create_task(_judge_worker(judge_queue, run_dir, grades))
+
+            # gather keeps ids in task order regardless of completion order
+            task_ids = await asyncio.gather(*(_run_one(i, task) for i, task in enumerate(tasks, 1)))
+
+            for _ in range(num_judges):
+                judge_queue.put_nowait(None)  # one stop signal per worker
     finally:
+        from agents._http import aclose_pooled_transport
+
+        await aclose_pooled_transport()
         if world_proc:
             world_proc.terminate()
             await world_proc.wait()
@@ -155,12 +208,19 @@ async def _main(
         "agent": agent_name.value,
         "tasks_dir": tasks_dir,
         "world": world,
-        "num_tasks": len(results),
-        "task_ids": [r["task_id"] for r in results],
+        "num_tasks": len(task_ids),
+        "task_ids": task_ids,
     }
-    (run_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    (run_dir / "manifest.json").write_bytes(to_json(manifest, indent=2))
     logger.success("Done. Results saved to {}/", run_dir)
 
+    if evaluate:
+        from evaluator.evaluate import write_summary
+
+        order = {tid: i for i, tid in enumerate(task_ids)}
+        grades.sort(key=lambda g: order[g.task_id])
+        write_summary(run_id, run_dir, grades)
+
 
 @app.command()
 def main(
@@ -170,8 +230,13 @@ def main(
     system_prompt: str = typer.Option("", "--system-prompt", "-s", help="System prompt passed to the agent"),
     world: str | None = typer.Option(None, "--world", "-w", help="Path to world server script (MCP tools)"),  # noqa: B008
     task_id: str | None = typer.Option(None, "--task-id", "-t", help="Run a single task by its ID (for debugging)"),  # noqa: B008
+    evaluate: bool = typer.Option(False, "--evaluate", "-e", help="Judge each task as soon as its agent run finishes"),
+    concurrency: int = typer.Option(
+        1, "--concurrency", "-c", min=1, help="Tasks run at once (keep at 1 for worlds with shared state)"
+    ),
 ):
-    asyncio.run(_main(agent, tasks_dir, output, system_prompt, world, task_id))
+    load_dotenv()  # Load .env before importing modules that may read env vars at import time
+    asyncio.run(_main(agent, tasks_dir, output, system_prompt, world, task_id, evaluate, concurrency))
 
 
 if __name__ == "__main__":
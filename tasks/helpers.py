@@ -1,5 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from pydantic import ValidationError
+
 from .types import Rubric, Task
 
 
@@ -9,11 +12,19 @@ def create_task(
     gold_response: str,
     rubric: list[str | Rubric],
     task_id: str | None = None,
+    max_turns: int | None = None,
 ) -> Task:
     rubric_items = [Rubric(criteria=r) if isinstance(r, str) else r for r in rubric]
     if task_id is not None:
-        return Task(id=task_id, domain=domain, prompt=prompt, gold_response=gold_response, rubric=rubric_items)
-    return Task(domain=domain, prompt=prompt, gold_response=gold_response, rubric=rubric_items)
+        return Task(
+            id=task_id,
+            domain=domain,
+            prompt=prompt,
+            gold_response=gold_response,
+            rubric=rubric_items,
+            max_turns=max_turns,
+        )
+    return Task(domain=domain, prompt=prompt, gold_response=gold_response, rubric=rubric_items, max_turns=max_turns)
 
 
 def save_task(task: Task, path: str | Path) -> None:
@@ -21,12 +32,18 @@ def save_task(task: Task, path: str | Path) -> None:
 
 
 def load_task(path: str | Path) -> Task:
-    return Task.model_validate_json(Path(path).read_text())
+    try:
+        return Task.model_validate_json(Path(path).read_bytes())
+    except ValidationError as e:
+        e.add_note(f"Task file: {path}")
+        raise
 
 
 def load_tasks(directory: str | Path) -> list[Task]:
-    directory = Path(directory)
-    tasks = []
-    for file in sorted(directory.glob("*.json")):
-        tasks.append(load_task(file))
-    return tasks
+    files = sorted(Path(directory).glob("*.json"))
+    if not files:
+        return []
+    # File reads release the GIL, so a small thread pool overlaps the I/O; order follows `files`.
+    # Each file is validated on its own, so an error names the file it came from.
+    with ThreadPoolExecutor(max_workers=min(32, len(files))) as pool:
+        return list(pool.map(load_task, files))
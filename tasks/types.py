@@ -1,4 +1,5 @@
 import uuid
+from functools import cached_property
 
 from pydantic import BaseModel, Field
 
@@ -13,3 +14,9 @@ class Task(BaseModel):
     prompt: str
     gold_response: str
     rubric: list[Rubric]
+    max_turns: int | None = None  # per-task cap on agent turns; None uses the agent's default
+
+    @cached_property
+    def criteria(self) -> list[str]:
+        """Rubric criteria as plain strings, built on first access."""
+        return [r.criteria for r in self.rubric]
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import functools
+import heapq
+import sys
+
 from fastmcp import FastMCP
 
 # ---------------------------------------------------------------------------
 # Hardcoded paper database
 # ---------------------------------------------------------------------------
 
-_PAPERS: list[dict] = [
+_PAPERS: tuple[dict, ...] = (
     # LLMs / AI
     {
         "id": "2501.12345",
@@ -207,33 +211,98 @@ _PAPERS: list[dict] = [
         "url": "https://arxiv.org/abs/2502.07788",
         "citations": 72,
     },
+)
+
+# The database is static: freeze list fields and intern category codes so repeated codes share one object
+for _p in _PAPERS:
+    _p["authors"] = tuple(_p["authors"])
+    _p["categories"] = tuple(sys.intern(c) for c in _p["categories"])
+
+
+def _joined(values: tuple[str, ...]) -> str:
+    """Lowercase and join on a control character (never typed in queries), so one `in` test covers every value."""
+    return "\x1f".join(v.lower() for v in values)
+
+
+# Search fields lowercased once at import: (paper, title, abstract, authors, categories)
+_SearchEntry = tuple[dict, str, str, str, str]
+_INDEX: list[_SearchEntry] = [
+    (p, p["title"].lower(), p["abstract"].lower(), _joined(p["authors"]), _joined(p["categories"])) for p in _PAPERS
 ]
 
 
-def _matches(query: str, paper: dict) -> bool:
-    q = query.lower()
-    return (
-        q in paper["title"].lower()
-        or q in paper["abstract"].lower()
-        or any(q in a.lower() for a in paper["authors"])
-        or any(q in c.lower() for c in paper["categories"])
-    )
+# Lookup tables for the non-search tools, built once at import. Sorts are stable, so ties keep
+# _PAPERS order exactly as the per-call sorts did.
+_BY_ID: dict[str, dict] = {p["id"]: p for p in _PAPERS}
+_BY_DATE: list[dict] = sorted(_PAPERS, key=lambda p: p["published"], reverse=True)
+_RECENT_BY_CATEGORY: dict[str, list[dict]] = {}
+for _p in _BY_DATE:
+    for _c in _p["categories"]:
+        _RECENT_BY_CATEGORY.setdefault(_c, []).append(_p)
+_CATEGORIES: tuple[str, ...] = tuple(sorted(_RECENT_BY_CATEGORY))
+# (paper, joined lowercased authors) by citations, for substring author lookups without a per-call sort
+_BY_CITATIONS: list[tuple[dict, str]] = [
+    (p, _joined(p["authors"])) for p in sorted(_PAPERS, key=lambda p: p["citations"], reverse=True)
+]
+
+
+def _summary(paper: dict) -> dict:
+    return {k: v for k, v in paper.items() if k != "abstract"}
+
+
+def _search_view(paper: dict) -> dict:
+    abstract = paper["abstract"]
+    return {
+        "id": paper["id"],
+        "title": paper["title"],
+        "authors": paper["authors"],
+        "categories": paper["categories"],
+        "published": paper["published"],
+        "url": paper["url"],
+        "citations": paper["citations"],
+        "abstract": abstract[:300] + "..." if len(abstract) > 300 else abstract,
+    }
 
 
-def _score(query: str, paper: dict) -> int:
-    q = query.lower()
+# Tool result views, built once per paper rather than per call. They are shared by every instance,
+# so tools return copies of them.
+_SUMMARIES: dict[str, dict] = {p["id"]: _summary(p) for p in _PAPERS}
+_SEARCH_VIEWS: dict[str, dict] = {p["id"]: _search_view(p) for p in _PAPERS}
+
+
+@functools.lru_cache(maxsize=128)
+def _recent(category: str | None, limit: int) -> tuple[dict, ...]:
+    """Abstract-free summaries for list_recent; _PAPERS is static, so entries never go stale."""
+    papers = _RECENT_BY_CATEGORY.get(category, []) if category else _BY_DATE
+    return tuple(_SUMMARIES[p["id"]] for p in papers[:limit])
+
+
+def _score(q: str, entry: _SearchEntry) -> int:
+    """Relevance of a paper to a lowercased query; a paper matches iff its score is > 0."""
+    _, title, abstract, authors, categories = entry
     score = 0
-    if q in paper["title"].lower():
+    if q in title:
         score += 3
-    if q in paper["abstract"].lower():
+    if q in abstract:
         score += 1
-    if any(q in a.lower() for a in paper["authors"]):
+    if q in authors:
         score += 2
-    if any(q in c.lower() for c in paper["categories"]):
+    if q in categories:
         score += 1
     return score
 
 
+def _by_relevance(match: tuple[dict, int]) -> int:
+    return match[1]
+
+
+# search_papers sort_by -> key over (paper, score) pairs; anything else sorts by relevance
+_SEARCH_SORT_KEYS = {
+    "citations": lambda match: match[0]["citations"],
+    "date": lambda match: match[0]["published"],
+}
+
+
 class ArxivApp:
     """Dummy arXiv application for searching and retrieving research papers."""
 
@@ -261,28 +330,13 @@ class ArxivApp:
             arxiv, search, papers, research, academic
         """
         max_results = min(max_results, 10)
-        matches = [(p, _score(query, p)) for p in _PAPERS if _matches(query, p)]
+        q = query.lower()
+        matches = [(entry[0], score) for entry in _INDEX if (score := _score(q, entry))]
 
-        if sort_by == "citations":
-            matches.sort(key=lambda x: x[0]["citations"], reverse=True)
-        elif sort_by == "date":
-            matches.sort(key=lambda x: x[0]["published"], reverse=True)
-        else:
-            matches.sort(key=lambda x: x[1], reverse=True)
+        # Only the top few are returned, so select them instead of sorting every match
+        top = heapq.nlargest(max_results, matches, key=_SEARCH_SORT_KEYS.get(sort_by, _by_relevance))
 
-        return [
-            {
-                "id": p["id"],
-                "title": p["title"],
-                "authors": p["authors"],
-                "categories": p["categories"],
-                "published": p["published"],
-                "url": p["url"],
-                "citations": p["citations"],
-                "abstract": p["abstract"][:300] + "..." if len(p["abstract"]) > 300 else p["abstract"],
-            }
-            for p, _ in matches[:max_results]
-        ]
+        return [dict(_SEARCH_VIEWS[p["id"]]) for p, _ in top]
 
     def get_paper(self, paper_id: str) -> dict:
         """Retrieve full details for a specific paper by its arXiv ID.
@@ -296,7 +350,7 @@ class ArxivApp:
         Tags:
             arxiv, paper, detail, read, full
         """
-        paper = next((p for p in _PAPERS if p["id"] == paper_id), None)
+        paper = _BY_ID.get(paper_id)
         if paper is None:
             return {"error": f"Paper '{paper_id}' not found."}
         return dict(paper)
@@ -315,11 +369,8 @@ class ArxivApp:
         Tags:
             arxiv, recent, new, papers, list
         """
-        papers = _PAPERS
-        if category:
-            papers = [p for p in papers if category in p["categories"]]
-        papers = sorted(papers, key=lambda p: p["published"], reverse=True)
-        return [{k: v for k, v in p.items() if k != "abstract"} for p in papers[:limit]]
+        # The cached tuple shares _SUMMARIES dicts across instances, so hand out copies
+        return [dict(s) for s in _recent(category, limit)]
 
     def list_categories(self) -> list[str]:
         """List all arXiv subject categories available in the database.
@@ -330,10 +381,7 @@ class ArxivApp:
         Tags:
             arxiv, categories, subjects, taxonomy
         """
-        cats: set[str] = set()
-        for p in _PAPERS:
-            cats.update(p["categories"])
-        return sorted(cats)
+        return list(_CATEGORIES)
 
     def get_by_author(self, author_name: str) -> list[dict]:
         """Find all papers by a specific author.
@@ -348,9 +396,7 @@ class ArxivApp:
             arxiv, author, papers, search, academic
         """
         name = author_name.lower()
-        matches = [p for p in _PAPERS if any(name in a.lower() for a in p["authors"])]
-        matches.sort(key=lambda p: p["citations"], reverse=True)
-        return [{k: v for k, v in p.items() if k != "abstract"} for p in matches]
+        return [dict(_SUMMARIES[p["id"]]) for p, authors in _BY_CITATIONS if name in authors]
 
     # ------------------------------------------------------------------
 
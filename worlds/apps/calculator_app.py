@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 import ast
+import functools
+import itertools
 import math
+import operator
 import statistics
+from collections.abc import Callable
+from types import CodeType
 
 from fastmcp import FastMCP
 
@@ -72,35 +77,183 @@ _SAFE_NAMES = {
 }
 
 
-def _check_safe(node: ast.AST) -> None:
-    if type(node) not in _SAFE_NODES:
-        raise ValueError(f"Unsafe operation: {type(node).__name__}")
-    for child in ast.iter_child_nodes(node):
-        _check_safe(child)
+@functools.lru_cache(maxsize=1024)
+def _compile_expr(expr: str) -> CodeType:
+    """Parse, validate and compile an expression once; agents often resubmit the same one.
 
-
-def _eval_expr(expr: str) -> float:
-    expr = expr.strip()
+    Invalid expressions raise and are therefore never cached.
+    """
     try:
         tree = ast.parse(expr, mode="eval")
     except SyntaxError as exc:
         raise ValueError(f"Syntax error: {exc}") from exc
-    _check_safe(tree.body)
 
-    # Extra check: only allow safe Name references
+    # One iterative pass: every node must be whitelisted, and names must be safe ones
     for node in ast.walk(tree):
-        if isinstance(node, ast.Name) and node.id not in _SAFE_NAMES:
+        node_type = type(node)
+        if node_type not in _SAFE_NODES:
+            raise ValueError(f"Unsafe operation: {node_type.__name__}")
+        if node_type is ast.Name and node.id not in _SAFE_NAMES:
             raise ValueError(f"Unknown name: '{node.id}'")
 
-    result = eval(compile(tree, "<expr>", "eval"), {"__builtins__": {}}, _SAFE_NAMES)  # noqa: S307
+    return compile(tree, "<expr>", "eval")
+
+
+def _parse_literal(expr: str) -> float | None:
+    """Plain numeric literals ('42', '-3.5', '1e6') skip the parse/compile/eval path entirely."""
+    try:
+        value = float(expr)
+    except ValueError:
+        return None
+    # nan/inf spellings go through the evaluator, which decides what they mean
+    return value if math.isfinite(value) else None
+
+
+def _eval_expr(expr: str) -> float:
+    result = eval(_compile_expr(expr.strip()), {"__builtins__": {}}, _SAFE_NAMES)  # noqa: S307
     return float(result)
 
 
+# ---------------------------------------------------------------------------
+# Unit conversion
+# ---------------------------------------------------------------------------
+
+# Unit -> (group, factor to the group's SI base unit); temperature is converted separately
+_TO_BASE: dict[str, tuple[str, float]] = {
+    # length → meters
+    "m": ("length", 1.0),
+    "km": ("length", 1000.0),
+    "cm": ("length", 0.01),
+    "mm": ("length", 0.001),
+    "mile": ("length", 1609.344),
+    "ft": ("length", 0.3048),
+    "inch": ("length", 0.0254),
+    "yard": ("length", 0.9144),
+    # weight → kg
+    "kg": ("weight", 1.0),
+    "g": ("weight", 0.001),
+    "lb": ("weight", 0.453592),
+    "oz": ("weight", 0.0283495),
+    "ton": ("weight", 907.185),
+    # temperature (special handling)
+    "celsius": ("temperature", 1.0),
+    "fahrenheit": ("temperature", 1.0),
+    "kelvin": ("temperature", 1.0),
+    # area → m²
+    "m2": ("area", 1.0),
+    "km2": ("area", 1e6),
+    "cm2": ("area", 1e-4),
+    "ft2": ("area", 0.092903),
+    "acre": ("area", 4046.86),
+    "hectare": ("area", 10000.0),
+    # volume → liters
+    "liter": ("volume", 1.0),
+    "ml": ("volume", 0.001),
+    "gallon": ("volume", 3.78541),
+    "quart": ("volume", 0.946353),
+    "pint": ("volume", 0.473176),
+    "cup": ("volume", 0.236588),
+    "fl_oz": ("volume", 0.0295735),
+    # speed → m/s
+    "m_s": ("speed", 1.0),
+    "km_h": ("speed", 1 / 3.6),
+    "mph": ("speed", 0.44704),
+    "knot": ("speed", 0.514444),
+    # time → seconds
+    "second": ("time", 1.0),
+    "minute": ("time", 60.0),
+    "hour": ("time", 3600.0),
+    "day": ("time", 86400.0),
+    "week": ("time", 604800.0),
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _factor(from_unit: str, to_unit: str) -> float:
+    """Direct from->to multiplier for non-temperature units."""
+    return _TO_BASE[from_unit][1] / _TO_BASE[to_unit][1]
+
+
+def _same_unit(value: float) -> float:
+    return value
+
+
+# (from, to) -> converter for the offset-based temperature scales
+_TEMP_CONVERTERS: dict[tuple[str, str], Callable[[float], float]] = {
+    ("celsius", "fahrenheit"): lambda v: v * 9 / 5 + 32,
+    ("fahrenheit", "celsius"): lambda v: (v - 32) * 5 / 9,
+    ("celsius", "kelvin"): lambda v: v + 273.15,
+    ("kelvin", "celsius"): lambda v: v - 273.15,
+    ("fahrenheit", "kelvin"): lambda v: (v - 32) * 5 / 9 + 273.15,
+    ("kelvin", "fahrenheit"): lambda v: (v - 273.15) * 9 / 5 + 32,
+}
+
+
+# ---------------------------------------------------------------------------
+# Statistics
+# ---------------------------------------------------------------------------
+
+# From this size on, the exact Fraction-based ``statistics`` functions dominate the call
+_FAST_STATS_MIN = 1000
+
+
+def _mode(numbers: list[float]) -> float | None:
+    try:
+        return statistics.mode(numbers)
+    except statistics.StatisticsError:
+        return None  # no unique mode
+
+
+def _welford(numbers: list[float]) -> tuple[int, float, float, float, float, float]:
+    """One pass yielding count, sum, mean, min, max and M2 (sum of squared deviations)."""
+    n = 0
+    total = mean = m2 = 0.0
+    lo, hi = math.inf, -math.inf
+    for x in numbers:
+        n += 1
+        total += x
+        if x < lo:
+            lo = x
+        if x > hi:
+            hi = x
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+    return n, total, mean, lo, hi, m2
+
+
+def _float_summary(numbers: list[float], include_all: bool) -> dict:
+    """Float-precision summary for large inputs, with every pass over the data running in C.
+
+    The sort yields min, max and median at once; fsum and sumprod keep the sums accurately rounded.
+    """
+    values = sorted(map(float, numbers))
+    n = len(values)
+    total = math.fsum(values)
+    mean = total / n
+    mid = n // 2
+    result: dict = {
+        "count": n,
+        "sum": total,
+        "mean": mean,
+        "median": values[mid] if n % 2 else (values[mid - 1] + values[mid]) / 2,
+        "min": values[0],
+        "max": values[-1],
+    }
+    if include_all:
+        result["mode"] = _mode(numbers)
+        deviations = list(map(operator.sub, values, itertools.repeat(mean, n)))
+        result["variance"] = math.sumprod(deviations, deviations) / (n - 1)
+        result["stdev"] = math.sqrt(result["variance"])
+    return result
+
+
 class CalculatorApp:
     """Safe mathematical calculator supporting arithmetic, algebra, and common math functions."""
 
     def __init__(self) -> None:
         self.name = "calculator"
+        self._server: FastMCP | None = None
 
     # ------------------------------------------------------------------
     # Tools
@@ -126,13 +279,16 @@ class CalculatorApp:
         Tags:
             calculator, math, expression, evaluate, compute
         """
-        try:
-            result = _eval_expr(expression)
-        except (ValueError, ZeroDivisionError, OverflowError) as exc:
-            return {"error": str(exc), "expression": expression}
+        result = _parse_literal(expression)
+        if result is None:
+            try:
+                result = _eval_expr(expression)
+            except (ValueError, ZeroDivisionError, OverflowError) as exc:
+                return {"error": str(exc), "expression": expression}
 
         out: dict = {"expression": expression, "result": result}
-        if result == int(result) and abs(result) < 1e15:
+        # is_integer() is False for nan/inf, so those no longer reach int() and overflow
+        if result.is_integer() and -1e15 < result < 1e15:
             out["result_int"] = int(result)
         return out
 
@@ -152,22 +308,32 @@ class CalculatorApp:
         """
         if not numbers:
             return {"error": "Cannot compute statistics on an empty list."}
-        result: dict = {
-            "count": len(numbers),
-            "sum": sum(numbers),
-            "mean": statistics.mean(numbers),
-            "median": statistics.median(numbers),
-            "min": min(numbers),
-            "max": max(numbers),
-        }
-        if include_all:
-            try:
-                result["mode"] = statistics.mode(numbers)
-            except statistics.StatisticsError:
-                result["mode"] = None  # no unique mode
-            if len(numbers) > 1:
-                result["variance"] = statistics.variance(numbers)
-                result["stdev"] = statistics.stdev(numbers)
+        if len(numbers) >= _FAST_STATS_MIN:
+            result = _float_summary(numbers, include_all)
+        elif include_all:
+            # Welford's online algorithm: a single stable pass instead of one per aggregate
+            n, total, mean, lo, hi, m2 = _welford(numbers)
+            result = {
+                "count": n,
+                "sum": total,
+                "mean": mean,
+                "median": statistics.median(numbers),
+                "min": lo,
+                "max": hi,
+                "mode": _mode(numbers),
+            }
+            if n > 1:
+                result["variance"] = m2 / (n - 1)
+                result["stdev"] = math.sqrt(result["variance"])
+        else:
+            result = {
+                "count": len(numbers),
+                "sum": sum(numbers),
+                "mean": statistics.mean(numbers),
+                "median": statistics.median(numbers),
+                "min": min(numbers),
+                "max": max(numbers),
+            }
         return result
 
     def convert_units(self, value: float, from_unit: str, to_unit: str) -> dict:
@@ -194,55 +360,6 @@ class CalculatorApp:
         Tags:
             calculator, convert, units, measurement, transform
         """
-        # Conversion factors to SI base unit
-        _TO_BASE: dict[str, tuple[str, float, float]] = {
-            # length → meters
-            "m": ("length", 1.0, 0),
-            "km": ("length", 1000.0, 0),
-            "cm": ("length", 0.01, 0),
-            "mm": ("length", 0.001, 0),
-            "mile": ("length", 1609.344, 0),
-            "ft": ("length", 0.3048, 0),
-            "inch": ("length", 0.0254, 0),
-            "yard": ("length", 0.9144, 0),
-            # weight → kg
-            "kg": ("weight", 1.0, 0),
-            "g": ("weight", 0.001, 0),
-            "lb": ("weight", 0.453592, 0),
-            "oz": ("weight", 0.0283495, 0),
-            "ton": ("weight", 907.185, 0),
-            # temperature (special handling)
-            "celsius": ("temperature", 1.0, 0),
-            "fahrenheit": ("temperature", 1.0, 0),
-            "kelvin": ("temperature", 1.0, 0),
-            # area → m²
-            "m2": ("area", 1.0, 0),
-            "km2": ("area", 1e6, 0),
-            "cm2": ("area", 1e-4, 0),
-            "ft2": ("area", 0.092903, 0),
-            "acre": ("area", 4046.86, 0),
-            "hectare": ("area", 10000.0, 0),
-            # volume → liters
-            "liter": ("volume", 1.0, 0),
-            "ml": ("volume", 0.001, 0),
-            "gallon": ("volume", 3.78541, 0),
-            "quart": ("volume", 0.946353, 0),
-            "pint": ("volume", 0.473176, 0),
-            "cup": ("volume", 0.236588, 0),
-            "fl_oz": ("volume", 0.0295735, 0),
-            # speed → m/s
-            "m_s": ("speed", 1.0, 0),
-            "km_h": ("speed", 1 / 3.6, 0),
-            "mph": ("speed", 0.44704, 0),
-            "knot": ("speed", 0.514444, 0),
-            # time → seconds
-            "second": ("time", 1.0, 0),
-            "minute": ("time", 60.0, 0),
-            "hour": ("time", 3600.0, 0),
-            "day": ("time", 86400.0, 0),
-            "week": ("time", 604800.0, 0),
-        }
-
         fu = from_unit.lower()
         tu = to_unit.lower()
 
@@ -259,23 +376,9 @@ class CalculatorApp:
 
         # Temperature is a special case (offset conversions)
         if from_group == "temperature":
-            if fu == "celsius" and tu == "fahrenheit":
-                result = value * 9 / 5 + 32
-            elif fu == "fahrenheit" and tu == "celsius":
-                result = (value - 32) * 5 / 9
-            elif fu == "celsius" and tu == "kelvin":
-                result = value + 273.15
-            elif fu == "kelvin" and tu == "celsius":
-                result = value - 273.15
-            elif fu == "fahrenheit" and tu == "kelvin":
-                result = (value - 32) * 5 / 9 + 273.15
-            elif fu == "kelvin" and tu == "fahrenheit":
-                result = (value - 273.15) * 9 / 5 + 32
-            else:
-                result = value  # same unit
+            result = _TEMP_CONVERTERS.get((fu, tu), _same_unit)(value)
         else:
-            base = value * _TO_BASE[fu][1]
-            result = base / _TO_BASE[tu][1]
+            result = value * _factor(fu, tu)
 
         return {"value": value, "from_unit": from_unit, "to_unit": to_unit, "result": round(result, 10)}
 
@@ -328,10 +431,12 @@ class CalculatorApp:
         return [self.calculate, self.statistics, self.convert_units, self.percent]
 
     def create_mcp_server(self) -> FastMCP:
-        mcp = FastMCP(self.name)
-        for tool_fn in self.list_tools():
-            mcp.tool()(tool_fn)
-        return mcp
+        # Registration introspects every tool signature, so build the server once per app instance
+        if self._server is None:
+            self._server = FastMCP(self.name)
+            for tool_fn in self.list_tools():
+                self._server.tool()(tool_fn)
+        return self._server
 
 
 if __name__ == "__main__":
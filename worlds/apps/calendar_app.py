@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-import uuid
+import bisect
+import itertools
+import secrets
 from datetime import datetime
 from typing import Literal
 
@@ -11,13 +13,64 @@ from fastmcp import FastMCP
 from worlds.utils import load_seed_data
 
 
+def _discard(index: dict[str, dict[str, None]], key: str, item_id: str) -> None:
+    ids = index[key]
+    del ids[item_id]
+    if not ids:
+        del index[key]
+
+
 class CalendarApp:
     """Dummy calendar application providing tools to manage calendar events."""
 
     def __init__(self) -> None:
         self.name = "calendar"
+        self._server: FastMCP | None = None
         self.data = load_seed_data("calendar")
-        self._events: dict[str, dict] = dict(self.data["_EVENTS"])
+        # Metadata and descriptions are stored apart so listings copy only the metadata
+        self._events: dict[str, dict] = {
+            event_id: {k: v for k, v in ev.items() if k != "description"}
+            for event_id, ev in self.data["_EVENTS"].items()
+        }
+        self._descriptions: dict[str, str] = {
+            event_id: ev["description"] for event_id, ev in self.data["_EVENTS"].items()
+        }
+        # event_id -> lowercased (title, description), refreshed whenever an event changes
+        self._lowered: dict[str, tuple[str, str]] = {}
+        # calendar -> event_ids in creation order (dict used as an ordered set)
+        self._by_calendar: dict[str, dict[str, None]] = {}
+        # "YYYY-MM-DD" prefix of the start time -> event_ids, for per-day lookups
+        self._by_date: dict[str, dict[str, None]] = {}
+        # event_id -> parsed (start, end), filled lazily and dropped when either time changes
+        self._spans: dict[str, tuple[datetime, datetime]] = {}
+        # (start, creation rank, event_id) kept sorted, so listings come out in start order;
+        # the rank keeps ties in creation order
+        self._timeline: list[tuple[str, int, str]] = []
+        self._rank: dict[str, int] = {}
+        self._ranks = itertools.count()
+        for ev in self._events.values():
+            self._index(ev)
+            self._by_calendar.setdefault(ev["calendar"], {})[ev["id"]] = None
+            self._by_date.setdefault(ev["start"][:10], {})[ev["id"]] = None
+            self._rank[ev["id"]] = next(self._ranks)
+            self._timeline.append((ev["start"], self._rank[ev["id"]], ev["id"]))
+        self._timeline.sort()
+
+    def _index(self, ev: dict) -> None:
+        self._lowered[ev["id"]] = (ev["title"].lower(), self._descriptions[ev["id"]].lower())
+
+    def _place(self, ev: dict) -> None:
+        bisect.insort(self._timeline, (ev["start"], self._rank[ev["id"]], ev["id"]))
+
+    def _displace(self, ev: dict) -> None:
+        del self._timeline[bisect.bisect_left(self._timeline, (ev["start"], self._rank[ev["id"]], ev["id"]))]
+
+    def _span(self, event_id: str) -> tuple[datetime, datetime]:
+        span = self._spans.get(event_id)
+        if span is None:
+            ev = self._events[event_id]
+            span = self._spans[event_id] = (datetime.fromisoformat(ev["start"]), datetime.fromisoformat(ev["end"]))
+        return span
 
     # ------------------------------------------------------------------
     # Tools
@@ -42,16 +95,14 @@ class CalendarApp:
         Tags:
             calendar, list, events, schedule, view
         """
+        # A 1-tuple sorts before every timeline entry with the same start
+        lo = bisect.bisect_left(self._timeline, (start_date,)) if start_date else 0
+        hi = bisect.bisect_left(self._timeline, (end_date,)) if end_date else len(self._timeline)
         results = []
-        for ev in self._events.values():
-            if calendar and ev["calendar"] != calendar:
-                continue
-            if start_date and ev["start"] < start_date:
-                continue
-            if end_date and ev["start"] >= end_date:
-                continue
-            results.append({k: v for k, v in ev.items() if k != "description"})
-        results.sort(key=lambda e: e["start"])
+        for _, _, event_id in self._timeline[lo:hi]:
+            ev = self._events[event_id]
+            if not calendar or ev["calendar"] == calendar:
+                results.append(dict(ev))
         return results
 
     def get_event(self, event_id: str) -> dict:
@@ -69,7 +120,7 @@ class CalendarApp:
         ev = self._events.get(event_id)
         if ev is None:
             return {"error": f"Event '{event_id}' not found."}
-        return dict(ev)
+        return {**ev, "description": self._descriptions[event_id]}
 
     def create_event(
         self,
@@ -96,19 +147,26 @@ class CalendarApp:
         Tags:
             calendar, create, event, schedule, add
         """
-        event_id = str(uuid.uuid4())[:8]
+        # Re-draw on the rare collision rather than overwrite another event (and its index entries)
+        while (event_id := secrets.token_hex(4)) in self._events:
+            pass
         event = {
             "id": event_id,
             "title": title,
             "start": start,
             "end": end,
             "attendees": attendees or [],
-            "description": description,
             "calendar": calendar,
             "status": "confirmed",
         }
         self._events[event_id] = event
-        return dict(event)
+        self._descriptions[event_id] = description
+        self._index(event)
+        self._by_calendar.setdefault(calendar, {})[event_id] = None
+        self._by_date.setdefault(start[:10], {})[event_id] = None
+        self._rank[event_id] = next(self._ranks)
+        self._place(event)
+        return {**event, "description": description}
 
     def update_event(
         self,
@@ -140,15 +198,23 @@ class CalendarApp:
             return {"error": f"Event '{event_id}' not found."}
         if title is not None:
             ev["title"] = title
+        if start is not None or end is not None:
+            self._spans.pop(event_id, None)
         if start is not None:
+            _discard(self._by_date, ev["start"][:10], event_id)
+            self._displace(ev)
             ev["start"] = start
+            self._by_date.setdefault(start[:10], {})[event_id] = None
+            self._place(ev)
         if end is not None:
             ev["end"] = end
         if description is not None:
-            ev["description"] = description
+            self._descriptions[event_id] = description
         if status is not None:
             ev["status"] = status
-        return dict(ev)
+        if title is not None or description is not None:
+            self._index(ev)
+        return {**ev, "description": self._descriptions[event_id]}
 
     def delete_event(self, event_id: str) -> dict:
         """Permanently delete a calendar event.
@@ -165,6 +231,13 @@ class CalendarApp:
         ev = self._events.pop(event_id, None)
         if ev is None:
             return {"error": f"Event '{event_id}' not found."}
+        del self._descriptions[event_id]
+        del self._lowered[event_id]
+        _discard(self._by_calendar, ev["calendar"], event_id)
+        _discard(self._by_date, ev["start"][:10], event_id)
+        self._spans.pop(event_id, None)
+        self._displace(ev)
+        del self._rank[event_id]
         return {"id": event_id, "title": ev["title"], "status": "deleted"}
 
     def search_events(self, query: str) -> list[dict]:
@@ -180,13 +253,11 @@ class CalendarApp:
             calendar, search, find, query, filter
         """
         q = query.lower()
-        results = [
-            {k: v for k, v in ev.items() if k != "description"}
-            for ev in self._events.values()
-            if q in ev["title"].lower() or q in ev["description"].lower()
+        return [
+            dict(self._events[event_id])
+            for _, _, event_id in self._timeline
+            if any(q in text for text in self._lowered[event_id])
         ]
-        results.sort(key=lambda e: e["start"])
-        return results
 
     def get_free_slots(self, date: str, duration_minutes: int = 60) -> list[dict]:
         """Find free time slots on a given day within working hours (9am–6pm).
@@ -205,11 +276,7 @@ class CalendarApp:
         day_end = datetime.fromisoformat(f"{date}T18:00:00")
 
         busy = sorted(
-            [
-                (datetime.fromisoformat(ev["start"]), datetime.fromisoformat(ev["end"]))
-                for ev in self._events.values()
-                if ev["start"].startswith(date)
-            ],
+            [self._span(event_id) for event_id in self._by_date.get(date, ())],
             key=lambda x: x[0],
         )
 
@@ -217,12 +284,12 @@ class CalendarApp:
         cursor = day_start
         for b_start, b_end in busy:
             if b_start > cursor:
-                gap_minutes = (b_start - cursor).seconds // 60
+                gap_minutes = int((b_start - cursor).total_seconds()) // 60
                 if gap_minutes >= duration_minutes:
                     slots.append({"start": cursor.isoformat(), "end": b_start.isoformat()})
             cursor = max(cursor, b_end)
         if cursor < day_end:
-            gap_minutes = (day_end - cursor).seconds // 60
+            gap_minutes = int((day_end - cursor).total_seconds()) // 60
             if gap_minutes >= duration_minutes:
                 slots.append({"start": cursor.isoformat(), "end": day_end.isoformat()})
         return slots
@@ -236,10 +303,7 @@ class CalendarApp:
         Tags:
             calendar, list, calendars, summary
         """
-        counts: dict[str, int] = {}
-        for ev in self._events.values():
-            counts[ev["calendar"]] = counts.get(ev["calendar"], 0) + 1
-        return [{"calendar": name, "total": count} for name, count in sorted(counts.items())]
+        return [{"calendar": name, "total": len(ids)} for name, ids in sorted(self._by_calendar.items())]
 
     # ------------------------------------------------------------------
 
@@ -262,10 +326,12 @@ class CalendarApp:
 
     def create_mcp_server(self) -> FastMCP:
         """Create and return a FastMCP server with all tools registered."""
-        mcp = FastMCP(self.name)
-        for tool_fn in self.list_tools():
-            mcp.tool()(tool_fn)
-        return mcp
+        # Registration introspects every tool signature, so build the server once per app instance
+        if self._server is None:
+            self._server = FastMCP(self.name)
+            for tool_fn in self.list_tools():
+                self._server.tool()(tool_fn)
+        return self._server
 
 
 # ---------------------------------------------------------------------------
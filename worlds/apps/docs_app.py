@@ -2,21 +2,143 @@
 
 from __future__ import annotations
 
-import uuid
-from datetime import datetime
+import heapq
+import itertools
+import re
+import secrets
 
 from fastmcp import FastMCP
 
-from worlds.utils import load_seed_data
+from worlds.utils import load_seed_data, now_iso
+
+_TOKEN_RE = re.compile(r"\w+")
+_TERM_CACHE_SIZE = 1024
+
+
+# Every field of a doc except its content, in seed-data order
+_META_KEYS = ("id", "title", "owner", "tags", "folder", "created_at", "updated_at")
+
+
+def _project(doc: dict) -> dict:
+    return {k: doc[k] for k in _META_KEYS}
+
+
+def _updated_at(doc: dict) -> str:
+    return doc["updated_at"]
 
 
 class DocsApp:
     """In-memory document store for creating, finding, and managing documents."""
 
+    # Methods exposed as MCP tools, in registration order
+    _TOOL_NAMES: tuple[str, ...] = (
+        "list_docs",
+        "get_doc",
+        "create_doc",
+        "update_doc",
+        "delete_doc",
+        "search_docs",
+        "list_folders",
+    )
+
     def __init__(self) -> None:
         self.name = "docs"
+        self._server: FastMCP | None = None
         self.data = load_seed_data("docs")
-        self._docs: dict[str, dict] = {d["id"]: d for d in self.data["_DOCS"]}
+        # Metadata and bodies are stored apart so listings can return metadata dicts as-is
+        self._docs: dict[str, dict] = {d["id"]: _project(d) for d in self.data["_DOCS"]}
+        self._contents: dict[str, str] = {d["id"]: d["content"] for d in self.data["_DOCS"]}
+        # doc_id -> lowercased (title, content, tags), refreshed whenever a doc changes;
+        # tags are joined on a control character (never typed in queries) so one `in` test covers them all
+        self._lowered: dict[str, tuple[str, str, str]] = {}
+        # Inverted index over the lowercased title, content and tags: token -> doc_ids
+        self._postings: dict[str, set[str]] = {}
+        self._doc_tokens: dict[str, set[str]] = {}
+        # query term -> doc_ids whose tokens contain it; emptied whenever any posting changes
+        self._term_hits: dict[str, set[str]] = {}
+        # doc_id -> creation rank, so index hits can be visited in the same order as self._docs
+        self._rank: dict[str, int] = {}
+        self._ranks = itertools.count()
+        # folder -> doc_ids, and lowercased folder -> doc_ids in creation order (dicts used as ordered sets);
+        # folder filters are case-insensitive, so lookups go through the second
+        self._by_folder: dict[str, dict[str, None]] = {}
+        self._by_folder_lc: dict[str, dict[str, None]] = {}
+        for doc in self._docs.values():
+            self._index(doc)
+            self._file(doc)
+
+    def _index(self, doc: dict) -> None:
+        doc_id = doc["id"]
+        title_lc = doc["title"].lower()
+        content_lc = self._contents[doc_id].lower()
+        tags_lc = "\x1f".join(tag.lower() for tag in doc["tags"])
+        self._lowered[doc_id] = (title_lc, content_lc, tags_lc)
+        self._rank.setdefault(doc_id, next(self._ranks))
+
+        tokens = set(_TOKEN_RE.findall(f"{title_lc} {content_lc} {tags_lc}"))
+        old = self._doc_tokens.get(doc_id, set())
+        if tokens != old:
+            self._term_hits.clear()
+        for token in old - tokens:
+            self._drop_posting(token, doc_id)
+        for token in tokens - old:
+            self._postings.setdefault(token, set()).add(doc_id)
+        self._doc_tokens[doc_id] = tokens
+
+    def _unindex(self, doc_id: str) -> None:
+        self._term_hits.clear()
+        for token in self._doc_tokens.pop(doc_id):
+            self._drop_posting(token, doc_id)
+        del self._lowered[doc_id]
+        del self._rank[doc_id]
+
+    def _drop_posting(self, token: str, doc_id: str) -> None:
+        ids = self._postings[token]
+        ids.discard(doc_id)
+        if not ids:
+            del self._postings[token]
+
+    def _candidates(self, q: str) -> set[str] | None:
+        """Doc ids that can contain the lowercased query ``q``, or None if the index cannot narrow it.
+
+        Every run of word characters in ``q`` has to fall inside a single indexed token, so a
+        match needs, for each such term, some token containing it. Scoring re-checks the substrings.
+        """
+        terms = _TOKEN_RE.findall(q)
+        if not terms:
+            return None
+        found: set[str] | None = None
+        for term in terms:
+            ids = self._term_hits.get(term)
+            if ids is None:
+                # Substring lookups scan the vocabulary; repeated queries reuse the result until the index changes
+                if len(self._term_hits) >= _TERM_CACHE_SIZE:
+                    self._term_hits.clear()
+                ids = self._term_hits[term] = set().union(
+                    *(posting for token, posting in self._postings.items() if term in token)
+                )
+            found = ids if found is None else found & ids
+            if not found:
+                break
+        return found
+
+    def _file(self, doc: dict) -> None:
+        doc_id, folder = doc["id"], doc["folder"]
+        self._by_folder.setdefault(folder, {})[doc_id] = None
+        folder_lc = folder.lower()
+        ids = self._by_folder_lc.setdefault(folder_lc, {})
+        last = next(reversed(ids), None)
+        ids[doc_id] = None
+        # A moved doc lands at the end; re-sort so folder listings keep creation order
+        if last is not None and self._rank[last] > self._rank[doc_id]:
+            self._by_folder_lc[folder_lc] = dict.fromkeys(sorted(ids, key=self._rank.__getitem__))
+
+    def _unfile(self, doc: dict) -> None:
+        for index, key in ((self._by_folder, doc["folder"]), (self._by_folder_lc, doc["folder"].lower())):
+            ids = index[key]
+            del ids[doc["id"]]
+            if not ids:
+                del index[key]
 
     # ------------------------------------------------------------------
     # Tools
@@ -36,11 +158,13 @@ class DocsApp:
         Tags:
             docs, list, documents, browse, folder
         """
-        docs = list(self._docs.values())
         if folder:
-            docs = [d for d in docs if d["folder"].lower() == folder.lower()]
-        docs.sort(key=lambda d: d["updated_at"], reverse=True)
-        return [{k: v for k, v in d.items() if k != "content"} for d in docs[:limit]]
+            docs = [self._docs[doc_id] for doc_id in self._by_folder_lc.get(folder.lower(), ())]
+        else:
+            docs = list(self._docs.values())
+        # Top-k selection; equivalent to a stable descending sort truncated to limit. Only the
+        # selected docs are copied, so callers can't reach the indexed metadata.
+        return [dict(doc) for doc in heapq.nlargest(limit, docs, key=_updated_at)]
 
     def get_doc(self, doc_id: str) -> dict:
         """Retrieve the full content of a document by its ID.
@@ -57,7 +181,7 @@ class DocsApp:
         doc = self._docs.get(doc_id)
         if doc is None:
             return {"error": f"Document '{doc_id}' not found."}
-        return dict(doc)
+        return {**doc, "content": self._contents[doc_id]}
 
     def create_doc(
         self,
@@ -82,12 +206,13 @@ class DocsApp:
         Tags:
             docs, create, new, write, document
         """
-        doc_id = f"doc{uuid.uuid4().hex[:6]}"
-        now = datetime.now().isoformat()
+        # Re-draw on the rare collision rather than overwrite another doc (and its index entries)
+        while (doc_id := f"doc{secrets.token_hex(3)}") in self._docs:
+            pass
+        now = now_iso()
         doc = {
             "id": doc_id,
             "title": title,
-            "content": content,
             "owner": owner,
             "tags": tags or [],
             "folder": folder,
@@ -95,7 +220,10 @@ class DocsApp:
             "updated_at": now,
         }
         self._docs[doc_id] = doc
-        return {k: v for k, v in doc.items() if k != "content"}
+        self._contents[doc_id] = content
+        self._index(doc)
+        self._file(doc)
+        return dict(doc)
 
     def update_doc(
         self,
@@ -126,13 +254,16 @@ class DocsApp:
         if title is not None:
             doc["title"] = title
         if content is not None:
-            doc["content"] = content
-        if folder is not None:
+            self._contents[doc_id] = content
+        if folder is not None and folder != doc["folder"]:
+            self._unfile(doc)
             doc["folder"] = folder
+            self._file(doc)
         if tags is not None:
             doc["tags"] = tags
-        doc["updated_at"] = datetime.now().isoformat()
-        return {k: v for k, v in doc.items() if k != "content"}
+        doc["updated_at"] = now_iso()
+        self._index(doc)
+        return dict(doc)
 
     def delete_doc(self, doc_id: str) -> dict:
         """Permanently delete a document.
@@ -149,6 +280,9 @@ class DocsApp:
         doc = self._docs.pop(doc_id, None)
         if doc is None:
             return {"error": f"Document '{doc_id}' not found."}
+        self._unindex(doc_id)
+        del self._contents[doc_id]
+        self._unfile(doc)
         return {"id": doc_id, "title": doc["title"], "status": "deleted"}
 
     def search_docs(self, query: str, folder: str | None = None) -> list[dict]:
@@ -156,6 +290,7 @@ class DocsApp:
 
         Args:
             query: Search string (case-insensitive), matched against title, content, and tags.
+                   Must be at least 2 characters; an empty query lists the newest documents instead.
             folder: Optional folder to restrict the search.
 
         Returns:
@@ -164,22 +299,36 @@ class DocsApp:
         Tags:
             docs, search, find, query, keyword
         """
+        if not query:
+            return self.list_docs(folder=folder)
+        if len(query) < 2:
+            return []
         q = query.lower()
+        candidates = self._candidates(q)
+        if folder:
+            in_folder = self._by_folder_lc.get(folder.lower(), {})
+            if candidates is None:
+                doc_ids = list(in_folder)
+            else:
+                doc_ids = sorted(candidates.intersection(in_folder), key=self._rank.__getitem__)
+        elif candidates is None:
+            doc_ids = list(self._docs)
+        else:
+            doc_ids = sorted(candidates, key=self._rank.__getitem__)
         results = []
-        for doc in self._docs.values():
-            if folder and doc["folder"].lower() != folder.lower():
-                continue
+        for doc_id in doc_ids:
+            title_lc, content_lc, tags_lc = self._lowered[doc_id]
             score = 0
-            if q in doc["title"].lower():
+            if q in title_lc:
                 score += 3
-            if q in doc["content"].lower():
+            if q in content_lc:
                 score += 1
-            if any(q in tag.lower() for tag in doc["tags"]):
+            if q in tags_lc:
                 score += 2
             if score > 0:
-                results.append((score, doc))
+                results.append((score, self._docs[doc_id]))
         results.sort(key=lambda x: x[0], reverse=True)
-        return [{k: v for k, v in d.items() if k != "content"} for _, d in results]
+        return [dict(doc) for _, doc in results]
 
     def list_folders(self) -> list[dict]:
         """List all folders with document counts.
@@ -190,29 +339,20 @@ class DocsApp:
         Tags:
             docs, folders, list, organize, browse
         """
-        from collections import Counter
-
-        counts: Counter[str] = Counter(d["folder"] for d in self._docs.values())
-        return [{"folder": folder, "doc_count": count} for folder, count in sorted(counts.items())]
+        return [{"folder": folder, "doc_count": len(ids)} for folder, ids in sorted(self._by_folder.items())]
 
     # ------------------------------------------------------------------
 
     def list_tools(self) -> list:
-        return [
-            self.list_docs,
-            self.get_doc,
-            self.create_doc,
-            self.update_doc,
-            self.delete_doc,
-            self.search_docs,
-            self.list_folders,
-        ]
+        return [getattr(self, name) for name in self._TOOL_NAMES]
 
     def create_mcp_server(self) -> FastMCP:
-        mcp = FastMCP(self.name)
-        for tool_fn in self.list_tools():
-            mcp.tool()(tool_fn)
-        return mcp
+        # Registration introspects every tool signature, so build the server once per app instance
+        if self._server is None:
+            self._server = FastMCP(self.name)
+            for name in self._TOOL_NAMES:
+                self._server.tool()(getattr(self, name))
+        return self._server
 
 
 if __name__ == "__main__":
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import uuid
-from datetime import datetime
+import heapq
+import itertools
+import secrets
 from typing import Literal
 
 from fastmcp import FastMCP
 
-from worlds.utils import load_seed_data
+from worlds.utils import load_seed_data, now_iso
 
 # ---------------------------------------------------------------------------
 # Dummy seed data
@@ -17,13 +18,79 @@ from worlds.utils import load_seed_data
 _FOLDERS = {"inbox", "sent", "drafts", "spam", "trash", "archive"}
 
 
+# Every field of an email except its body, in seed-data order
+_EMAIL_META_KEYS = ("id", "from", "to", "subject", "folder", "read", "timestamp")
+
+
+def _project(msg: dict) -> dict:
+    return {k: msg[k] for k in _EMAIL_META_KEYS}
+
+
+def _search_blob(msg: dict) -> str:
+    return f"{msg['subject']}\x1f{msg['body']}".lower()
+
+
+def _timestamp(msg: dict) -> str:
+    return msg["timestamp"]
+
+
 class EmailApp:
     """Dummy email application providing tools to read, search, and manage emails."""
 
+    # Methods exposed as MCP tools, in registration order
+    _TOOL_NAMES: tuple[str, ...] = (
+        "list_emails",
+        "get_email",
+        "mark_as_read",
+        "search_emails",
+        "send_email",
+        "delete_email",
+        "move_email",
+        "get_folders",
+    )
+
     def __init__(self) -> None:
         self.name = "email"
+        self._server: FastMCP | None = None
         self.data = load_seed_data("email")
         self._emails: dict[str, dict] = self.data["_EMAILS"]
+        # email_id -> position in self._emails, so folder buckets can keep that same order
+        self._rank: dict[str, int] = {}
+        self._ranks = itertools.count()
+        # folder -> {email_id: email} in self._emails order, and folder -> ids of its unread emails;
+        # a folder's bucket is dropped once it empties
+        self._by_folder: dict[str, dict[str, dict]] = {}
+        self._unread_by_folder: dict[str, set[str]] = {}
+        # email_id -> lowercased subject and body, joined on a control character (never typed in
+        # queries) so one `in` test covers both; kept apart so returned emails carry no extra keys
+        self._search_blobs: dict[str, str] = {}
+        for msg in self._emails.values():
+            self._file(msg)
+            self._search_blobs[msg["id"]] = _search_blob(msg)
+
+    def _file(self, msg: dict) -> None:
+        email_id, folder = msg["id"], msg["folder"]
+        rank = self._rank.setdefault(email_id, next(self._ranks))
+        bucket = self._by_folder.setdefault(folder, {})
+        last = next(reversed(bucket), None)
+        bucket[email_id] = msg
+        # A moved email lands at the end; re-sort so ties in listings still break by self._emails order
+        if last is not None and self._rank[last] > rank:
+            self._by_folder[folder] = dict(sorted(bucket.items(), key=lambda item: self._rank[item[0]]))
+        if not msg["read"]:
+            self._unread_by_folder.setdefault(folder, set()).add(email_id)
+
+    def _unfile(self, msg: dict) -> None:
+        email_id, folder = msg["id"], msg["folder"]
+        bucket = self._by_folder[folder]
+        del bucket[email_id]
+        if not bucket:
+            del self._by_folder[folder]
+        unread = self._unread_by_folder.get(folder)
+        if unread is not None:
+            unread.discard(email_id)
+            if not unread:
+                del self._unread_by_folder[folder]
 
     # ------------------------------------------------------------------
     # Tools
@@ -48,13 +115,16 @@ class EmailApp:
         Tags:
             email, list, inbox, folder, read
         """
-        results = [
-            {k: v for k, v in msg.items() if k != "body"}
-            for msg in self._emails.values()
-            if msg["folder"] == folder and (not unread_only or not msg["read"])
-        ]
-        results.sort(key=lambda m: m["timestamp"], reverse=True)
-        return results[:limit]
+        bucket = self._by_folder.get(folder, {})
+        if unread_only:
+            if folder not in self._unread_by_folder:
+                return []
+            matches = (msg for msg in bucket.values() if not msg["read"])
+        else:
+            matches = bucket.values()
+        # Top-k selection (a stable descending sort truncated to limit); strip bodies of the winners only
+        newest = heapq.nlargest(limit, matches, key=_timestamp)
+        return [_project(msg) for msg in newest]
 
     def get_email(self, email_id: str) -> dict:
         """Retrieve a single email by its ID, including the full body.
@@ -88,7 +158,12 @@ class EmailApp:
         email = self._emails.get(email_id)
         if email is None:
             return {"error": f"Email '{email_id}' not found."}
-        email["read"] = True
+        if not email["read"]:
+            email["read"] = True
+            unread = self._unread_by_folder[email["folder"]]
+            unread.discard(email_id)
+            if not unread:
+                del self._unread_by_folder[email["folder"]]
         return {"id": email_id, "read": True, "status": "updated"}
 
     def search_emails(self, query: str, folder: str | None = None) -> list[dict]:
@@ -106,11 +181,10 @@ class EmailApp:
         """
         q = query.lower()
         results = []
-        for msg in self._emails.values():
-            if folder and msg["folder"] != folder:
-                continue
-            if q in msg["subject"].lower() or q in msg["body"].lower():
-                results.append({k: v for k, v in msg.items() if k != "body"})
+        blobs = self._search_blobs
+        for email_id, msg in (self._by_folder.get(folder, {}) if folder else self._emails).items():
+            if q in blobs[email_id]:
+                results.append(_project(msg))
         results.sort(key=lambda m: m["timestamp"], reverse=True)
         return results
 
@@ -128,8 +202,10 @@ class EmailApp:
         Tags:
             email, send, compose, create, outbox
         """
-        email_id = str(uuid.uuid4())[:8]
-        self._emails[email_id] = {
+        # Re-draw on the rare collision rather than overwrite another email (and its folder index entries)
+        while (email_id := secrets.token_hex(4)) in self._emails:
+            pass
+        msg = {
             "id": email_id,
             "from": "me@example.com",
             "to": to,
@@ -137,8 +213,11 @@ class EmailApp:
             "body": body,
             "folder": "sent",
             "read": True,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
         }
+        self._emails[email_id] = msg
+        self._file(msg)
+        self._search_blobs[email_id] = _search_blob(msg)
         return {"id": email_id, "status": "sent"}
 
     def delete_email(self, email_id: str) -> dict:
@@ -158,7 +237,9 @@ class EmailApp:
             return {"error": f"Email '{email_id}' not found."}
         if email["folder"] == "trash":
             return {"id": email_id, "status": "already in trash"}
+        self._unfile(email)
         email["folder"] = "trash"
+        self._file(email)
         return {"id": email_id, "status": "moved to trash"}
 
     def move_email(
@@ -182,7 +263,10 @@ class EmailApp:
         if email is None:
             return {"error": f"Email '{email_id}' not found."}
         old_folder = email["folder"]
-        email["folder"] = folder
+        if folder != old_folder:
+            self._unfile(email)
+            email["folder"] = folder
+            self._file(email)
         return {"id": email_id, "from_folder": old_folder, "to_folder": folder, "status": "moved"}
 
     def get_folders(self) -> list[dict]:
@@ -194,15 +278,14 @@ class EmailApp:
         Tags:
             email, folders, inbox, counts, summary
         """
-        counts: dict[str, dict] = {f: {"folder": f, "total": 0, "unread": 0} for f in _FOLDERS}
-        for msg in self._emails.values():
-            folder = msg["folder"]
-            if folder not in counts:
-                counts[folder] = {"folder": folder, "total": 0, "unread": 0}
-            counts[folder]["total"] += 1
-            if not msg["read"]:
-                counts[folder]["unread"] += 1
-        return sorted(counts.values(), key=lambda x: x["folder"])
+        return [
+            {
+                "folder": folder,
+                "total": len(self._by_folder.get(folder, ())),
+                "unread": len(self._unread_by_folder.get(folder, ())),
+            }
+            for folder in sorted(_FOLDERS.union(self._by_folder))
+        ]
 
     # ------------------------------------------------------------------
 
@@ -212,23 +295,15 @@ class EmailApp:
         Returns:
             list: Callable tool methods.
         """
-        return [
-            self.list_emails,
-            self.get_email,
-            self.mark_as_read,
-            self.search_emails,
-            self.send_email,
-            self.delete_email,
-            self.move_email,
-            self.get_folders,
-        ]
+        return [getattr(self, name) for name in self._TOOL_NAMES]
 
     def create_mcp_server(self) -> FastMCP:
         """Create and return a FastMCP server with all tools registered."""
-        mcp = FastMCP(self.name)
-        for tool_fn in self.list_tools():
-            mcp.tool()(tool_fn)
-        return mcp
+        if self._server is None:
+            self._server = FastMCP(self.name)
+            for name in self._TOOL_NAMES:
+                self._server.tool()(getattr(self, name))
+        return self._server
 
 
 # ---------------------------------------------------------------------------
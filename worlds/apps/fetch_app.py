@@ -2,83 +2,221 @@
 
 from __future__ import annotations
 
-import urllib.error
-import urllib.request
-from html.parser import HTMLParser
-
+import asyncio
+import contextlib
+import html
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from weakref import WeakKeyDictionary
+
+import httpx
 from fastmcp import FastMCP
+from pydantic_core import from_json
 
 # ---------------------------------------------------------------------------
 # HTML → plain text stripper
 # ---------------------------------------------------------------------------
 
 
-class _HTMLStripper(HTMLParser):
-    """Minimal HTML-to-text converter."""
-
-    _SKIP_TAGS = {"script", "style", "head", "meta", "link", "noscript"}
-
-    def __init__(self) -> None:
-        super().__init__()
-        self._skip = False
-        self._skip_stack: list[str] = []
-        self._parts: list[str] = []
-
-    def handle_starttag(self, tag: str, attrs: list) -> None:
-        if tag in self._SKIP_TAGS:
-            self._skip_stack.append(tag)
-        if tag in {"p", "br", "div", "h1", "h2", "h3", "h4", "li", "tr"}:
-            self._parts.append("\n")
-
-    def handle_endtag(self, tag: str) -> None:
-        if self._skip_stack and self._skip_stack[-1] == tag:
-            self._skip_stack.pop()
-
-    def handle_data(self, data: str) -> None:
-        if not self._skip_stack:
-            self._parts.append(data)
-
-    def get_text(self) -> str:
-        raw = "".join(self._parts)
-        lines = [line.strip() for line in raw.splitlines()]
-        # collapse blank lines
-        result: list[str] = []
-        blank = False
-        for line in lines:
-            if line:
-                result.append(line)
-                blank = False
-            elif not blank:
-                result.append("")
-                blank = True
-        return "\n".join(result).strip()
-
-
-def _fetch_url(url: str, timeout: int = 10) -> tuple[str, str, int]:
-    """Return (content, content_type, status_code). Raises on network error."""
-    req = urllib.request.Request(
+# Elements whose content is never text. Void tags (meta, link) are simply dropped with the other tags.
+_SKIP_RE = re.compile(
+    r"<!--.*?(?:-->|\Z)"
+    r"|<(script|style|noscript)\b.*?(?:</\1\s*>|\Z)"
+    r"|<head\b.*?(?:</head\s*>|(?=<body\b)|\Z)",
+    re.DOTALL | re.IGNORECASE,
+)
+# Attributes may contain '>' inside quotes
+_ATTRS = r"""(?:[^>"']|"[^"]*"|'[^']*')*"""
+# Start tags that begin a new line of text
+_BLOCK_TAG_RE = re.compile(rf"<(?:p|br|div|h[1-4]|li|tr)(?=[\s/>]){_ATTRS}>", re.IGNORECASE)
+_TAG_RE = re.compile(rf"</?[a-zA-Z]{_ATTRS}>|<[!?]{_ATTRS}>")
+
+
+def _html_to_text(body: str, max_chars: int | None = None) -> str:
+    """Minimal HTML-to-text converter.
+
+    Runs as a few regex substitutions, so the scanning happens in C rather than in a
+    per-tag Python callback as with ``html.parser``. With ``max_chars``, growing prefixes
+    of the body are converted first, and a prefix's text is returned once it is already
+    longer than ``max_chars``; its first ``max_chars`` characters match the full conversion.
+    """
+    if max_chars is not None:
+        end = 16 * max_chars + 65_536
+        while end < len(body):
+            # Cutting just before a tag keeps tags and entities whole
+            cut = body.rfind("<", 0, end)
+            if cut < 0:
+                cut = end
+            # Lines before the last one are final; the last may be cut short
+            text = _strip_html(body[:cut]).rpartition("\n")[0]
+            if len(text) > max_chars:
+                return text
+            end *= 4
+    return _strip_html(body)
+
+
+def _strip_html(body: str) -> str:
+    # Every markup pattern starts with '<'; bodies without one (e.g. JSON served as text/html) skip the passes
+    if "<" in body:
+        body = _SKIP_RE.sub("", body)
+        body = _BLOCK_TAG_RE.sub("\n", body)
+        body = _TAG_RE.sub("", body)
+    raw = html.unescape(body)
+    # collapse blank lines
+    result: list[str] = []
+    blank = False
+    for line in raw.splitlines():
+        line = line.strip()
+        if line:
+            result.append(line)
+            blank = False
+        elif not blank:
+            result.append("")
+            blank = True
+    return "\n".join(result).strip()
+
+
+_LIMITS = httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30.0)
+
+# One keep-alive pool per event loop (pooled connections are bound to the loop that opened them),
+# so repeat calls to a host skip the TCP and TLS handshakes without blocking the server's loop
+_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = WeakKeyDictionary()
+
+
+def _client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = _clients[loop] = httpx.AsyncClient(follow_redirects=True, limits=_LIMITS)
+    return client
+
+
+@contextlib.asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[dict]:
+    """Close the serving loop's pooled client when the server shuts down."""
+    try:
+        yield {}
+    finally:
+        client = _clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+# get_json refuses bodies above this size instead of parsing them
+_MAX_JSON_BYTES = 100_000
+
+# Stripping a page this large takes long enough that it runs in a worker thread rather than on the loop
+_OFFLOAD_BYTES = 64_000
+
+
+async def _fetch_url(url: str, timeout: int = 10) -> tuple[bytes, str, int]:
+    """Return (raw body, content_type, status_code). Raises on network error or an error status."""
+    resp = await _client().get(
         url,
         headers={"User-Agent": ("Mozilla/5.0 (compatible; ga-bench-fetch/1.0; +https://github.com/example/ga-bench)")},
+        timeout=timeout,
     )
-    with urllib.request.urlopen(req, timeout=timeout) as resp:  # noqa: S310
-        status = resp.status
-        ctype: str = resp.headers.get("Content-Type", "text/plain")
-        raw = resp.read()
-    content = raw.decode("utf-8", errors="replace")
-    return content, ctype, status
+    resp.raise_for_status()
+    ctype: str = resp.headers.get("Content-Type", "text/plain")
+    return resp.content, ctype, resp.status_code
+
+
+async def _fetch(url: str, timeout: int) -> tuple[bytes, str, int] | dict:
+    """``_fetch_url`` with failures turned into the tools' error dicts."""
+    try:
+        return await _fetch_url(url, timeout=timeout)
+    except httpx.HTTPStatusError as exc:
+        return _status_error(exc, url)
+    except httpx.TimeoutException:
+        return {"error": f"Request timed out after {timeout}s", "url": url}
+    except httpx.HTTPError as exc:
+        return {"error": f"Network error: {exc}", "url": url}
+    except Exception as exc:  # noqa: BLE001
+        return {"error": f"Unexpected error: {exc}", "url": url}
+
+
+def _status_error(exc: httpx.HTTPStatusError, url: str) -> dict:
+    code = exc.response.status_code
+    return {"error": f"HTTP {code}: {exc.response.reason_phrase}", "url": url, "status_code": code}
+
+
+def _decode(raw: bytes, ctype: str) -> str:
+    """Decode with the charset the Content-Type declares, falling back to UTF-8."""
+    charset = ctype.lower().partition("charset=")[2].split(";")[0].strip(" \"'") or "utf-8"
+    try:
+        return raw.decode(charset, errors="replace")
+    except LookupError:
+        return raw.decode("utf-8", errors="replace")
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire ``ttl`` seconds after insertion."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(entry[1])
+
+    def put(self, key: tuple, value: dict) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, dict(value))
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+
+
+def _is_success(result: dict) -> bool:
+    return 200 <= result.get("status_code", 0) < 300 and "error" not in result
 
 
 class FetchApp:
     """Real HTTP fetch application — retrieves live content from the web."""
 
+    # Methods exposed as MCP tools, in registration order
+    _TOOL_NAMES: tuple[str, ...] = (
+        "get",
+        "head",
+        "get_json",
+        "clear_cache",
+    )
+
     def __init__(self) -> None:
         self.name = "fetch"
+        self._server: FastMCP | None = None
+        # Agents often retry or replay the same fetch; successful responses are reused for a minute
+        self._cache = _TTLCache(maxsize=256, ttl=60.0)
 
     # ------------------------------------------------------------------
     # Tools
     # ------------------------------------------------------------------
 
-    def get(
+    async def get(
         self,
         url: str,
         as_text: bool = True,
@@ -104,36 +242,40 @@ class FetchApp:
         """
         if not url.startswith(("http://", "https://")):
             return {"error": "URL must start with http:// or https://"}
-        timeout = min(timeout, 30)
-        try:
-            body, ctype, status = _fetch_url(url, timeout=timeout)
-        except urllib.error.HTTPError as exc:
-            return {"error": f"HTTP {exc.code}: {exc.reason}", "url": url, "status_code": exc.code}
-        except urllib.error.URLError as exc:
-            return {"error": f"Network error: {exc.reason}", "url": url}
-        except TimeoutError:
-            return {"error": f"Request timed out after {timeout}s", "url": url}
-        except Exception as exc:  # noqa: BLE001
-            return {"error": f"Unexpected error: {exc}", "url": url}
+        key = ("GET", url, as_text, max_chars)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        fetched = await _fetch(url, min(timeout, 30))
+        if isinstance(fetched, dict):
+            return fetched
+        raw, ctype, status = fetched
 
         is_html = "html" in ctype.lower()
         if as_text and is_html:
-            stripper = _HTMLStripper()
-            stripper.feed(body)
-            content = stripper.get_text()
+            text = _decode(raw, ctype)
+            if len(raw) > _OFFLOAD_BYTES:
+                content = await asyncio.to_thread(_html_to_text, text, max_chars)
+            else:
+                content = _html_to_text(text, max_chars)
         else:
-            content = body
+            # No character takes more than 4 bytes, so a longer body is truncated anyway and
+            # decoding this prefix still yields more than max_chars characters
+            content = _decode(raw[: 4 * max_chars + 4], ctype)
 
         truncated = len(content) > max_chars
-        return {
+        result = {
             "url": url,
             "status_code": status,
             "content_type": ctype,
             "content": content[:max_chars],
             "truncated": truncated,
         }
+        if _is_success(result):
+            self._cache.put(key, result)
+        return result
 
-    def head(self, url: str, timeout: int = 10) -> dict:
+    async def head(self, url: str, timeout: int = 10) -> dict:
         """Fetch only the HTTP headers for a URL without downloading the body.
 
         Args:
@@ -149,30 +291,38 @@ class FetchApp:
         """
         if not url.startswith(("http://", "https://")):
             return {"error": "URL must start with http:// or https://"}
+        key = ("HEAD", url)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
         timeout = min(timeout, 30)
         try:
-            req = urllib.request.Request(
+            resp = await _client().head(
                 url,
-                method="HEAD",
                 headers={"User-Agent": "Mozilla/5.0 (compatible; ga-bench-fetch/1.0)"},
+                timeout=timeout,
             )
-            with urllib.request.urlopen(req, timeout=timeout) as resp:  # noqa: S310
-                headers = dict(resp.headers)
-                return {
-                    "url": url,
-                    "status_code": resp.status,
-                    "content_type": headers.get("Content-Type", "unknown"),
-                    "content_length": headers.get("Content-Length", "unknown"),
-                    "headers": headers,
-                }
-        except urllib.error.HTTPError as exc:
-            return {"error": f"HTTP {exc.code}: {exc.reason}", "url": url, "status_code": exc.code}
-        except urllib.error.URLError as exc:
-            return {"error": f"Network error: {exc.reason}", "url": url}
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            return _status_error(exc, url)
+        except httpx.HTTPError as exc:
+            return {"error": f"Network error: {exc}", "url": url}
         except Exception as exc:  # noqa: BLE001
             return {"error": f"Unexpected error: {exc}", "url": url}
+        # Header names keep the casing the server sent
+        headers = {name.decode("latin-1"): value.decode("latin-1") for name, value in resp.headers.raw}
+        result = {
+            "url": url,
+            "status_code": resp.status_code,
+            "content_type": resp.headers.get("Content-Type", "unknown"),
+            "content_length": resp.headers.get("Content-Length", "unknown"),
+            "headers": headers,
+        }
+        if _is_success(result):
+            self._cache.put(key, result)
+        return result
 
-    def get_json(self, url: str, timeout: int = 10) -> dict:
+    async def get_json(self, url: str, timeout: int = 10) -> dict:
         """Fetch a JSON endpoint and return the parsed response.
 
         Args:
@@ -186,27 +336,52 @@ class FetchApp:
         Tags:
             fetch, json, api, http, request, parse
         """
-        result = self.get(url, as_text=False, max_chars=100_000, timeout=timeout)
-        if "error" in result:
-            return result
-        import json
-
+        if not url.startswith(("http://", "https://")):
+            return {"error": "URL must start with http:// or https://"}
+        key = ("JSON", url)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        fetched = await _fetch(url, min(timeout, 30))
+        if isinstance(fetched, dict):
+            return fetched
+        raw, _, status = fetched
+        if len(raw) > _MAX_JSON_BYTES:
+            return {"error": f"Response is too large to parse ({len(raw)} bytes, limit {_MAX_JSON_BYTES})", "url": url}
         try:
-            data = json.loads(result["content"])
-        except json.JSONDecodeError as exc:
+            # pydantic-core's Rust parser reads the raw bytes directly, with no str round-trip
+            data = from_json(raw)
+        except ValueError as exc:
             return {"error": f"Response is not valid JSON: {exc}", "url": url}
-        return {"url": url, "status_code": result["status_code"], "data": data}
+        result = {"url": url, "status_code": status, "data": data}
+        if _is_success(result):
+            self._cache.put(key, result)
+        return result
+
+    def clear_cache(self) -> dict:
+        """Discard cached responses so the next get/head/get_json call hits the network again.
+
+        Successful responses are otherwise reused for up to 60 seconds.
+
+        Returns:
+            dict: Contains 'cleared', the number of cached responses discarded.
+
+        Tags:
+            fetch, cache, clear, refresh, invalidate
+        """
+        return {"cleared": self._cache.clear()}
 
     # ------------------------------------------------------------------
 
     def list_tools(self) -> list:
-        return [self.get, self.head, self.get_json]
+        return [getattr(self, name) for name in self._TOOL_NAMES]
 
     def create_mcp_server(self) -> FastMCP:
-        mcp = FastMCP(self.name)
-        for tool_fn in self.list_tools():
-            mcp.tool()(tool_fn)
-        return mcp
+        if self._server is None:
+            self._server = FastMCP(self.name, lifespan=_lifespan)
+            for name in self._TOOL_NAMES:
+                self._server.tool()(getattr(self, name))
+        return self._server
 
 
 if __name__ == "__main__":
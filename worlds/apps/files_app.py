@@ -3,22 +3,24 @@
 from __future__ import annotations
 
 import csv
-import io
+import itertools
 import os
+import stat
 
 from fastmcp import FastMCP
 
-# Directories the tool is allowed to read from (prefix-matched).
-_ALLOWED_PREFIXES = (
-    os.path.abspath("tasks/"),
-    os.path.abspath("worlds/"),
-    "/tmp/",
-)
+# Directories the tool is allowed to read from, normalised and ending in a separator so that
+# a sibling such as tasks_private/ does not match tasks/.
+_ALLOWED_PREFIXES = tuple(os.path.join(os.path.abspath(p), "") for p in ("tasks/", "worlds/", "/tmp/"))
+
+# Files up to this size are read whole in binary; larger ones only up to max_chars through text mode
+_SMALL_FILE_BYTES = 16 * 1024
 
 
 def _allowed(path: str) -> bool:
-    abs_path = os.path.abspath(path)
-    return any(abs_path.startswith(p) for p in _ALLOWED_PREFIXES)
+    # abspath is resolved per call so relative paths follow the same cwd open() will use;
+    # the appended separator lets an allowed directory itself match its own prefix
+    return os.path.join(os.path.abspath(path), "").startswith(_ALLOWED_PREFIXES)
 
 
 class FilesApp:
@@ -50,12 +52,23 @@ class FilesApp:
         if not _allowed(path):
             return {"error": f"Access denied: '{path}' is outside the allowed directory."}
         try:
-            size = os.path.getsize(path)
-        except OSError as exc:
-            return {"error": str(exc), "path": path}
-        try:
-            with open(path, encoding="utf-8", errors="replace") as fh:
-                content = fh.read(max_chars + 1)
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                st = os.fstat(fd)
+                size = st.st_size
+                # A small regular file is read whole with one syscall and decoded once, skipping the
+                # text-IO stack; special files (FIFOs, /proc) may report size 0, so they never take this path
+                data = os.read(fd, size) if stat.S_ISREG(st.st_mode) and size <= _SMALL_FILE_BYTES else None
+            finally:
+                os.close(fd)
+            if data is None:
+                with open(path, encoding="utf-8", errors="replace") as fh:
+                    content = fh.read(max_chars + 1)
+            else:
+                content = data.decode("utf-8", errors="replace")
+                # Text mode would have translated line endings
+                if "\r" in content:
+                    content = content.replace("\r\n", "\n").replace("\r", "\n")
         except OSError as exc:
             return {"error": str(exc), "path": path}
         truncated = len(content) > max_chars
@@ -85,32 +98,32 @@ class FilesApp:
         if not _allowed(path):
             return {"error": f"Access denied: '{path}' is outside the allowed directory."}
         try:
-            with open(path, encoding="utf-8", errors="replace") as fh:
-                raw = fh.read()
+            # Stream the file: only the returned rows become dicts, the rest are just counted
+            with open(path, newline="", encoding="utf-8", errors="replace") as fh:
+                reader = csv.DictReader(fh)
+                headers = reader.fieldnames or []
+                rows = list(itertools.islice(reader, max(max_rows, 0)))
+                # DictReader skips blank lines, so the remaining count does too
+                total = len(rows) + sum(1 for row in reader.reader if row)
         except OSError as exc:
             return {"error": str(exc), "path": path}
-        try:
-            reader = csv.DictReader(io.StringIO(raw))
-            headers = reader.fieldnames or []
-            all_rows = list(reader)
         except csv.Error as exc:
             return {"error": f"CSV parse error: {exc}", "path": path}
-        total = len(all_rows)
-        truncated = total > max_rows
         return {
             "path": path,
             "headers": list(headers),
-            "rows": all_rows[:max_rows],
+            "rows": rows,
             "total_rows": total,
-            "truncated": truncated,
+            "truncated": total > len(rows),
         }
 
-    def list_files(self, directory: str, extension: str | None = None) -> dict:
+    def list_files(self, directory: str, extension: str | list[str] | None = None) -> dict:
         """List files in a directory, optionally filtered by extension.
 
         Args:
             directory: Path to the directory to list. Must be inside tasks/ or worlds/.
-            extension: Optional file extension to filter by (e.g. '.csv', '.json').
+            extension: Optional file extension to filter by (e.g. '.csv'), or a list of
+                       extensions to accept any of (e.g. ['.csv', '.json']).
 
         Returns:
             dict: Contains 'directory' and 'files' (list of dicts with name, path,
@@ -121,17 +134,18 @@ class FilesApp:
         """
         if not _allowed(directory):
             return {"error": f"Access denied: '{directory}' is outside the allowed directory."}
+        suffixes = (extension,) if isinstance(extension, str) else tuple(extension or ())
         try:
-            entries = os.listdir(directory)
+            with os.scandir(directory) as it:
+                # The name test is free, so it runs first; DirEntry carries the file type from readdir,
+                # so only matching files cost a stat()
+                entries = sorted(
+                    (e for e in it if (not suffixes or e.name.endswith(suffixes)) and e.is_file()),
+                    key=lambda e: e.name,
+                )
         except OSError as exc:
             return {"error": str(exc), "directory": directory}
-        files = []
-        for entry in sorted(entries):
-            if extension and not entry.endswith(extension):
-                continue
-            full = os.path.join(directory, entry)
-            if os.path.isfile(full):
-                files.append({"name": entry, "path": full, "size_bytes": os.path.getsize(full)})
+        files = [{"name": e.name, "path": e.path, "size_bytes": e.stat().st_size} for e in entries]
         return {"directory": directory, "files": files}
 
     # ------------------------------------------------------------------
@@ -3,12 +3,28 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from operator import itemgetter
 from typing import Literal
 
 from fastmcp import FastMCP
 
-from worlds.utils import load_seed_data
+from worlds.utils import load_seed_data, now_iso
+
+# Fields left out of list summaries. Records do not all share one key set (some repos carry
+# _BRANCHES, merged PRs carry merged/merged_at), so summaries drop these rather than pick fields.
+_REPO_HIDDEN = ("id",)
+_ITEM_HIDDEN = ("id", "body")
+
+# Listings cached between mutations; the cache is emptied when it reaches this many entries
+_LIST_CACHE_SIZE = 256
+
+
+def _summary(record: dict, hidden: tuple[str, ...]) -> dict:
+    # A C-level copy plus a pop per hidden key beats filtering every field through items()
+    summary = dict(record)
+    for key in hidden:
+        summary.pop(key, None)
+    return summary
 
 
 class GitHubApp:
@@ -17,10 +33,37 @@ class GitHubApp:
     def __init__(self) -> None:
         self.name = "github"
         self.data = load_seed_data("github")
-        self._repos: dict[str, dict] = {k: dict(v) for k, v in self.data["_REPOS"].items()}
-        self._issues: dict[str, dict] = {k: dict(v) for k, v in self.data["_ISSUES"].items()}
-        self._prs: dict[str, dict] = {k: dict(v) for k, v in self.data["_PULL_REQUESTS"].items()}
-        self._comments: dict[str, dict] = {k: dict(v) for k, v in self.data["_COMMENTS"].items()}
+        # load_seed_data builds fresh objects on every call, so this instance can mutate them in place
+        self._repos: dict[str, dict] = self.data["_REPOS"]
+        self._issues: dict[str, dict] = self.data["_ISSUES"]
+        self._prs: dict[str, dict] = self.data["_PULL_REQUESTS"]
+        self._comments: dict[str, dict] = self.data["_COMMENTS"]
+        # repo -> number -> issue / PR, in self._issues / self._prs order
+        self._issues_by_repo: dict[str, dict[int, dict]] = {}
+        self._prs_by_repo: dict[str, dict[int, dict]] = {}
+        for issue in self._issues.values():
+            self._issues_by_repo.setdefault(issue["repo"], {}).setdefault(issue["number"], issue)
+        for pr in self._prs.values():
+            self._prs_by_repo.setdefault(pr["repo"], {}).setdefault(pr["number"], pr)
+        # repo -> highest issue number handed out so far; issues are never deleted, so it only grows
+        self._last_issue_number: dict[str, int] = {repo: max(issues) for repo, issues in self._issues_by_repo.items()}
+        # (target_type, target_id) -> comments in self._comments order
+        self._comments_by_target: dict[tuple[str, str], list[dict]] = {}
+        for comment in self._comments.values():
+            self._comments_by_target.setdefault((comment["target_type"], comment["target_id"]), []).append(comment)
+        # (tool name, *arguments) -> summaries it returned; emptied by every mutating tool
+        self._list_cache: dict[tuple, list[dict]] = {}
+
+    def _cached(self, key: tuple) -> list[dict] | None:
+        result = self._list_cache.get(key)
+        # Fresh dicts in a fresh list each time, so callers cannot edit, reorder or truncate the cached ones
+        return None if result is None else [dict(r) for r in result]
+
+    def _remember(self, key: tuple, result: list[dict]) -> list[dict]:
+        if len(self._list_cache) >= _LIST_CACHE_SIZE:
+            self._list_cache.clear()
+        self._list_cache[key] = result
+        return [dict(r) for r in result]
 
     # ------------------------------------------------------------------
     # Tools
@@ -39,13 +82,17 @@ class GitHubApp:
         Tags:
             github, repos, list, browse, repositories
         """
+        key = ("list_repos", owner, include_archived)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
         repos = [
             r
             for r in self._repos.values()
             if (owner is None or r["owner"] == owner) and (include_archived or not r["archived"])
         ]
-        repos.sort(key=lambda r: r["updated_at"], reverse=True)
-        return [{k: v for k, v in r.items() if k != "id"} for r in repos]
+        repos.sort(key=itemgetter("updated_at"), reverse=True)
+        return self._remember(key, [_summary(r, _REPO_HIDDEN) for r in repos])
 
     def get_repo(self, repo: str) -> dict:
         """Get full details for a repository.
@@ -85,16 +132,19 @@ class GitHubApp:
         Tags:
             github, issues, list, bugs, tasks
         """
+        key = ("list_issues", repo, state, None if labels is None else tuple(labels), assignee)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
         issues = [
             i
-            for i in self._issues.values()
-            if i["repo"] == repo
-            and (state == "all" or i["state"] == state)
+            for i in self._issues_by_repo.get(repo, {}).values()
+            if (state == "all" or i["state"] == state)
             and (labels is None or all(lb in i["labels"] for lb in labels))
             and (assignee is None or assignee in i["assignees"])
         ]
-        issues.sort(key=lambda i: i["updated_at"], reverse=True)
-        return [{k: v for k, v in i.items() if k not in {"id", "body"}} for i in issues]
+        issues.sort(key=itemgetter("updated_at"), reverse=True)
+        return self._remember(key, [_summary(i, _ITEM_HIDDEN) for i in issues])
 
     def get_issue(self, repo: str, issue_number: int) -> dict:
         """Get full details for an issue, including body.
@@ -109,10 +159,10 @@ class GitHubApp:
         Tags:
             github, issue, get, detail, read
         """
-        for issue in self._issues.values():
-            if issue["repo"] == repo and issue["number"] == issue_number:
-                return dict(issue)
-        return {"error": f"Issue #{issue_number} not found in '{repo}'."}
+        issue = self._issues_by_repo.get(repo, {}).get(issue_number)
+        if issue is None:
+            return {"error": f"Issue #{issue_number} not found in '{repo}'."}
+        return dict(issue)
 
     def create_issue(
         self,
@@ -139,10 +189,13 @@ class GitHubApp:
         """
         if repo not in self._repos:
             return {"error": f"Repository '{repo}' not found."}
-        issue_id = "i" + str(uuid.uuid4())[:6]
-        existing_numbers = [i["number"] for i in self._issues.values() if i["repo"] == repo]
-        number = max(existing_numbers, default=0) + 1
-        self._issues[issue_id] = {
+        # Re-draw on the rare collision rather than overwrite another issue (and its index entry)
+        while (issue_id := "i" + str(uuid.uuid4())[:6]) in self._issues:
+            pass
+        number = self._last_issue_number.get(repo, 0) + 1
+        self._last_issue_number[repo] = number
+        now = now_iso()
+        issue = {
             "id": issue_id,
             "number": number,
             "repo": repo,
@@ -153,10 +206,13 @@ class GitHubApp:
             "labels": labels or [],
             "state": "open",
             "comments": 0,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": now,
+            "updated_at": now,
         }
+        self._issues[issue_id] = issue
+        self._issues_by_repo.setdefault(repo, {})[number] = issue
         self._repos[repo]["open_issues"] += 1
+        self._list_cache.clear()
         return {"id": issue_id, "number": number, "repo": repo, "status": "created"}
 
     def close_issue(self, repo: str, issue_number: int) -> dict:
@@ -172,15 +228,16 @@ class GitHubApp:
         Tags:
             github, issue, close, resolve, done
         """
-        for issue in self._issues.values():
-            if issue["repo"] == repo and issue["number"] == issue_number:
-                if issue["state"] == "closed":
-                    return {"number": issue_number, "state": "closed", "status": "already closed"}
-                issue["state"] = "closed"
-                issue["updated_at"] = datetime.now().isoformat()
-                self._repos[repo]["open_issues"] = max(0, self._repos[repo]["open_issues"] - 1)
-                return {"number": issue_number, "state": "closed", "status": "updated"}
-        return {"error": f"Issue #{issue_number} not found in '{repo}'."}
+        issue = self._issues_by_repo.get(repo, {}).get(issue_number)
+        if issue is None:
+            return {"error": f"Issue #{issue_number} not found in '{repo}'."}
+        if issue["state"] == "closed":
+            return {"number": issue_number, "state": "closed", "status": "already closed"}
+        issue["state"] = "closed"
+        issue["updated_at"] = now_iso()
+        self._repos[repo]["open_issues"] = max(0, self._repos[repo]["open_issues"] - 1)
+        self._list_cache.clear()
+        return {"number": issue_number, "state": "closed", "status": "updated"}
 
     def list_pull_requests(
         self,
@@ -201,13 +258,17 @@ class GitHubApp:
         Tags:
             github, pull_requests, list, prs, reviews
         """
+        key = ("list_pull_requests", repo, state, include_drafts)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
         prs = [
             pr
-            for pr in self._prs.values()
-            if pr["repo"] == repo and (state == "all" or pr["state"] == state) and (include_drafts or not pr["draft"])
+            for pr in self._prs_by_repo.get(repo, {}).values()
+            if (state == "all" or pr["state"] == state) and (include_drafts or not pr["draft"])
         ]
-        prs.sort(key=lambda pr: pr["updated_at"], reverse=True)
-        return [{k: v for k, v in pr.items() if k not in {"id", "body"}} for pr in prs]
+        prs.sort(key=itemgetter("updated_at"), reverse=True)
+        return self._remember(key, [_summary(pr, _ITEM_HIDDEN) for pr in prs])
 
     def get_pull_request(self, repo: str, pr_number: int) -> dict:
         """Get full details for a pull request, including body.
@@ -222,10 +283,10 @@ class GitHubApp:
         Tags:
             github, pull_request, get, detail, review
         """
-        for pr in self._prs.values():
-            if pr["repo"] == repo and pr["number"] == pr_number:
-                return dict(pr)
-        return {"error": f"PR #{pr_number} not found in '{repo}'."}
+        pr = self._prs_by_repo.get(repo, {}).get(pr_number)
+        if pr is None:
+            return {"error": f"PR #{pr_number} not found in '{repo}'."}
+        return dict(pr)
 
     def add_comment(self, target_type: Literal["issue", "pr"], repo: str, number: int, body: str) -> dict:
         """Add a comment to an issue or pull request.
@@ -242,22 +303,27 @@ class GitHubApp:
         Tags:
             github, comment, add, reply, discuss
         """
-        collection = self._issues if target_type == "issue" else self._prs
-        for item in collection.values():
-            if item["repo"] == repo and item["number"] == number:
-                comment_id = "ic" + str(uuid.uuid4())[:6]
-                self._comments[comment_id] = {
-                    "id": comment_id,
-                    "target_id": item["id"],
-                    "target_type": target_type,
-                    "author": "me",
-                    "body": body,
-                    "created_at": datetime.now().isoformat(),
-                }
-                if target_type == "issue":
-                    item["comments"] += 1
-                return {"id": comment_id, "status": "created"}
-        return {"error": f"{target_type.upper()} #{number} not found in '{repo}'."}
+        by_repo = self._issues_by_repo if target_type == "issue" else self._prs_by_repo
+        item = by_repo.get(repo, {}).get(number)
+        if item is None:
+            return {"error": f"{target_type.upper()} #{number} not found in '{repo}'."}
+        # Re-draw on the rare collision rather than overwrite another comment
+        while (comment_id := "ic" + str(uuid.uuid4())[:6]) in self._comments:
+            pass
+        comment = {
+            "id": comment_id,
+            "target_id": item["id"],
+            "target_type": target_type,
+            "author": "me",
+            "body": body,
+            "created_at": now_iso(),
+        }
+        self._comments[comment_id] = comment
+        self._comments_by_target.setdefault((target_type, item["id"]), []).append(comment)
+        if target_type == "issue":
+            item["comments"] += 1
+            self._list_cache.clear()
+        return {"id": comment_id, "status": "created"}
 
     def get_comments(self, target_type: Literal["issue", "pr"], repo: str, number: int) -> list[dict]:
         """Get all comments on an issue or pull request.
@@ -273,19 +339,12 @@ class GitHubApp:
         Tags:
             github, comments, get, discussion, thread
         """
-        collection = self._issues if target_type == "issue" else self._prs
-        target_id = None
-        for item in collection.values():
-            if item["repo"] == repo and item["number"] == number:
-                target_id = item["id"]
-                break
-        if target_id is None:
+        by_repo = self._issues_by_repo if target_type == "issue" else self._prs_by_repo
+        item = by_repo.get(repo, {}).get(number)
+        if item is None:
             return [{"error": f"{target_type.upper()} #{number} not found in '{repo}'."}]
-        comments = [
-            c for c in self._comments.values() if c["target_id"] == target_id and c["target_type"] == target_type
-        ]
-        comments.sort(key=lambda c: c["created_at"])
-        return comments
+        # sorted() copies, so callers never get the index's own list
+        return sorted(self._comments_by_target.get((target_type, item["id"]), ()), key=itemgetter("created_at"))
 
     def list_branches(self, repo: str) -> list[dict]:
         """List branches in a repository.
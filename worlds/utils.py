@@ -1,13 +1,30 @@
+import functools
 import json
 import re
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+# (epoch second, its local ISO prefix); only the microseconds are formatted per call
+_now_prefix: tuple[int, str] = (-1, "")
+
+
+def now_iso() -> str:
+    """Same string as ``datetime.now().isoformat()``, reusing the date/time prefix within a second."""
+    global _now_prefix
+    sec, us = divmod(time.time_ns() // 1000, 1_000_000)
+    if sec != _now_prefix[0]:
+        _now_prefix = (sec, datetime.fromtimestamp(sec).isoformat())
+    # isoformat() omits the fraction entirely when it is zero
+    return f"{_now_prefix[1]}.{us:06d}" if us else _now_prefix[1]
+
+
+_NOW_TAG_RE = re.compile(r"\{\{NOW(?:([+-]\d+)([dhm]))?\}\}")
+
 
 def _replace_now_tags(text: str, base_time: datetime) -> str:
     """Replaces {{NOW}}, {{NOW+1d}}, {{NOW-2h}}, etc. with ISO 8601 strings."""
-    pattern = re.compile(r"\{\{NOW(?:([+-]\d+)([dhm]))?\}\}")
 
     def replacer(match: re.Match) -> str:
         amount_str = match.group(1)
@@ -25,7 +42,7 @@ def _replace_now_tags(text: str, base_time: datetime) -> str:
 
         return target_time.isoformat()
 
-    return pattern.sub(replacer, text)
+    return _NOW_TAG_RE.sub(replacer, text)
 
 
 def _process_node(node: Any, base_time: datetime) -> Any:
@@ -35,22 +52,26 @@ def _process_node(node: Any, base_time: datetime) -> Any:
     elif isinstance(node, list):
         return [_process_node(item, base_time) for item in node]
     elif isinstance(node, str):
-        return _replace_now_tags(node, base_time)
+        return _replace_now_tags(node, base_time) if "{{" in node else node
     else:
         return node
 
 
+@functools.cache
+def _read_seed_file() -> dict:
+    """Parses seed_data.json once per process; load_seed_data copies out of it, so it is never mutated."""
+    data_file = Path(__file__).parent / "data" / "seed_data.json"
+
+    with open(data_file, encoding="utf-8") as f:
+        return json.load(f)
+
+
 def load_seed_data(app_name: str) -> dict:
     """
     Loads seed data from worlds/data/seed_data.json for a given app.
     Replaces {{NOW}}, {{NOW+1d}}, etc. with ISO formatted strings.
     """
-    data_file = Path(__file__).parent / "data" / "seed_data.json"
-
-    with open(data_file, encoding="utf-8") as f:
-        all_data = json.load(f)
-
-    app_data = all_data[app_name]
+    app_data = _read_seed_file()[app_name]
     base_time = datetime.now()
 
     return _process_node(app_data, base_time)